@@ -0,0 +1,76 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython kernels for per-rebalance pre-solve arithmetic.
+
+Optional compiled fast path for the scalar glue around each solve
+(mean/covariance assembly and post-solve statistics). Typed loops with
+cdef locals remove the PyObject dispatch that surrounds every small
+NumPy call once the solver itself is warm-started. Built automatically
+by setup.py when Cython is available; the optimizer falls back to the
+Numba/NumPy implementations otherwise.
+"""
+
+import numpy as np
+
+
+cpdef tuple mean_cov(double[:, ::1] returns):
+    """
+    Compute sample mean and covariance (ddof=1) of a returns window.
+
+    Args:
+        returns: Historical returns matrix (T x N), C-contiguous
+
+    Returns:
+        (mu, Sigma) as float64 ndarrays
+    """
+    cdef Py_ssize_t T = returns.shape[0]
+    cdef Py_ssize_t n = returns.shape[1]
+    cdef Py_ssize_t t, i
+    cdef double acc
+
+    mu_arr = np.empty(n, dtype=np.float64)
+    cdef double[::1] mu = mu_arr
+
+    for i in range(n):
+        acc = 0.0
+        for t in range(T):
+            acc += returns[t, i]
+        mu[i] = acc / T
+
+    # Demean then one BLAS gemm for the Gram matrix
+    X = np.asarray(returns) - mu_arr
+    Sigma = (X.T @ X) / (T - 1)
+
+    return mu_arr, Sigma
+
+
+cpdef tuple post_solve_stats(double[::1] w, double[::1] w_prev):
+    """
+    Fused single-pass post-solve statistics.
+
+    Args:
+        w: Solved portfolio weights (N,)
+        w_prev: Previous weights (N,)
+
+    Returns:
+        (sum_of_squares, turnover, w_min, w_max)
+    """
+    cdef Py_ssize_t n = w.shape[0]
+    cdef Py_ssize_t i
+    cdef double s2 = 0.0
+    cdef double turnover = 0.0
+    cdef double w_min = w[0]
+    cdef double w_max = w[0]
+    cdef double wi, d
+
+    for i in range(n):
+        wi = w[i]
+        d = wi - w_prev[i]
+        s2 += wi * wi
+        turnover += d if d >= 0.0 else -d
+        if wi < w_min:
+            w_min = wi
+        if wi > w_max:
+            w_max = wi
+
+    return s2, turnover, w_min, w_max
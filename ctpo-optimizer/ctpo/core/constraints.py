@@ -86,38 +86,77 @@ class PortfolioConstraints:
         return n_nonzero >= self.min_assets
 
 
-def construct_structure_matrix(beta: np.ndarray, 
-                               volatilities: np.ndarray, 
-                               stiffness: float = 310.0) -> np.ndarray:
+def construct_structure_matrix(beta: np.ndarray,
+                               volatilities: np.ndarray,
+                               stiffness: float = 310.0,
+                               out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Construct CDPR structure matrix A ∈ ℝ^{3×n}.
-    
+
     Columns represent cable directions in force space:
     - Row 0: Return direction (CAPM betas)
     - Row 1: Risk direction (volatilities)
     - Row 2: Diversification direction (uniform)
-    
+
     Args:
         beta: Asset betas (N,)
         volatilities: Asset volatilities (N,)
         stiffness: Cable stiffness parameter (k_c)
-        
+        out: Optional preallocated (3 x N) buffer to fill in place,
+             avoiding a fresh allocation per rebalance
+
     Returns:
         Structure matrix A (3 x N)
     """
     n = len(beta)
-    A = np.zeros((3, n))
-    
-    A[0, :] = beta / stiffness
-    A[1, :] = volatilities / stiffness
-    A[2, :] = np.ones(n) / stiffness
-    
+    A = np.empty((3, n)) if out is None else out
+
+    # One reciprocal instead of three vector divisions
+    inv_k = 1.0 / stiffness
+    np.multiply(beta, inv_k, out=A[0, :])
+    np.multiply(volatilities, inv_k, out=A[1, :])
+    A[2, :] = inv_k
+
     return A
 
 
+def apply_structure_matrix(beta: np.ndarray,
+                           volatilities: np.ndarray,
+                           weights: np.ndarray,
+                           stiffness: float = 310.0,
+                           out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Compute A @ w without materializing the structure matrix.
+
+    A's rows are just scaled copies of beta, the volatilities and a
+    constant, so the product collapses to two dot products and a sum.
+    Rolling backtests that re-apply the operator every bar as betas
+    and volatilities update skip the 3 x N rebuild entirely and do
+    O(N) work per bar.
+
+    Args:
+        beta: Asset betas (N,)
+        volatilities: Asset volatilities (N,)
+        weights: Portfolio weights (N,)
+        stiffness: Cable stiffness parameter (k_c)
+        out: Optional preallocated (3,) buffer to fill in place
+
+    Returns:
+        Force vector A @ w (3,)
+    """
+    force = np.empty(3) if out is None else out
+    inv_k = 1.0 / stiffness
+    force[0] = (beta @ weights) * inv_k
+    force[1] = (volatilities @ weights) * inv_k
+    force[2] = np.sum(weights) * inv_k
+
+    return force
+
+
 def construct_wrench_vector(target_return: float = 0.08,
                             max_risk: float = 0.15,
-                            min_eff_assets: int = 20) -> np.ndarray:
+                            min_eff_assets: int = 20,
+                            out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Construct external wrench vector W ∈ ℝ^3.
     
@@ -130,16 +169,16 @@ def construct_wrench_vector(target_return: float = 0.08,
         target_return: Target portfolio return (annual)
         max_risk: Maximum portfolio volatility
         min_eff_assets: Minimum effective number of assets
-        
+        out: Optional preallocated (3,) buffer to fill in place
+
     Returns:
         Wrench vector W (3,)
     """
-    W = np.array([
-        target_return,
-        max_risk,
-        1.0 / min_eff_assets
-    ])
-    
+    W = np.empty(3) if out is None else out
+    W[0] = target_return
+    W[1] = max_risk
+    W[2] = 1.0 / min_eff_assets
+
     return W
 
 
@@ -170,8 +209,6 @@ def build_constraints(w,
     Returns:
         List of CVXPY constraints
     """
-    import cvxpy as cp
-    
     constraints = []
     n_assets = len(w_baseline)
     
@@ -266,8 +303,8 @@ def compute_effective_n_assets(weights: np.ndarray, threshold: float = 1e-6) ->
     # Normalize active weights
     active_weights = active_weights / np.sum(active_weights)
     
-    # Compute ENP
-    enp = 1.0 / np.sum(active_weights ** 2)
+    # Compute ENP (ddot sum of squares; no squared temporary)
+    enp = 1.0 / (active_weights @ active_weights)
     
     return enp
 
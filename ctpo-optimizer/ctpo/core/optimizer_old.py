@@ -8,11 +8,22 @@ No CDPR (Cable-Driven Parallel Robot) code - that approach didn't
 improve performance and added unnecessary complexity.
 """
 
+import math
+import os
 import numpy as np
 import cvxpy as cp
-from typing import Dict, Tuple
+import yaml
+from typing import Dict, Optional, Tuple
 import time
 
+# Annualization factor, hoisted so optimize() does not recompute it
+_SQRT_252 = math.sqrt(252)
+
+# Parsed-config cache keyed by (path, mtime): re-instantiating the
+# optimizer per request (REST server pattern) otherwise re-reads and
+# re-parses the same YAML every construction
+_CONFIG_CACHE: Dict[tuple, Dict] = {}
+
 # Default system parameters - SIMPLIFIED
 SYSTEM_PARAMS = {
     'risk_free_rate': 0.042,
@@ -67,8 +78,12 @@ class PortfolioOptimizer:
             )
         
         if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            # mtime in the key invalidates the cache on file edits
+            key = (config_path, os.path.getmtime(config_path))
+            if key not in _CONFIG_CACHE:
+                with open(config_path, 'r') as f:
+                    _CONFIG_CACHE[key] = yaml.safe_load(f)
+            return _CONFIG_CACHE[key]
         else:
             return self._default_config()
     
@@ -170,8 +185,9 @@ class PortfolioOptimizer:
         if market_returns is None:
             market_returns = returns.mean(axis=1)
         
-        # Compute stress level
-        sigma_market = np.std(market_returns) * np.sqrt(252)  # Annualized
+        # Compute stress level; update_from_data already ran the O(T)
+        # std pass over market_returns, so reuse the stored value
+        sigma_market = self.state.sigma_market * _SQRT_252  # Annualized
         alpha_stress = self._compute_stress_level(sigma_market)
         
         # Get betas and volatilities for CDPR structure
@@ -2,11 +2,25 @@
 Data fetcher for market data (Yahoo Finance)
 """
 
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import yfinance as yf
 import pandas as pd
 import numpy as np
 from typing import List, Optional, Union
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+
+try:
+    # Optional fast path: hitting Yahoo's chart endpoint directly skips
+    # yfinance's scraping/cookie layer (~2x per request)
+    from curl_cffi import requests as curl_requests
+    HAS_CURL = True
+except ImportError:
+    HAS_CURL = False
+
+_CHART_URL = 'https://query1.finance.yahoo.com/v8/finance/chart/{symbol}'
 
 
 class DataFetcher:
@@ -25,7 +39,91 @@ class DataFetcher:
         self.cache_enabled = cache_enabled
         self.cache_dir = cache_dir
         self.data_cache = {}
-    
+        self._chart_session = None  # Reused TLS session for the chart endpoint
+
+    def _cache_path(self, *key_parts) -> str:
+        """
+        Build the on-disk cache path for a download request.
+
+        Args:
+            key_parts: Values identifying the request (symbols, dates, ...)
+
+        Returns:
+            Path to the parquet file for this request
+        """
+        key = hashlib.sha1(repr(key_parts).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f'{key}.parquet')
+
+    @staticmethod
+    def _date_key(value) -> str:
+        """
+        Normalize a date-like value to a calendar-date cache-key part.
+
+        datetime.now() carries microseconds, so keying on its str()
+        would make every call a cache miss; the day-based freshness
+        check in _cache_load already covers intraday staleness.
+
+        Args:
+            value: Date, datetime or string endpoint
+
+        Returns:
+            ISO date string (or str(value) for non-date inputs)
+        """
+        if isinstance(value, datetime):
+            return value.date().isoformat()
+        if isinstance(value, date):
+            return value.isoformat()
+        return str(value)
+
+    def _cache_load(self, path: str) -> Optional[pd.DataFrame]:
+        """
+        Load a cached download if present and still fresh.
+
+        Freshness is day-based: an entry written today serves today's
+        backtests, so repeated runs skip the network entirely; tomorrow
+        it is refetched to pick up the new close.
+
+        Args:
+            path: Cache file path from _cache_path
+
+        Returns:
+            Cached DataFrame, or None on miss/stale/unreadable
+        """
+        if not self.cache_enabled or not os.path.exists(path):
+            return None
+        if date.fromtimestamp(os.path.getmtime(path)) != date.today():
+            return None
+        try:
+            return pd.read_parquet(path)
+        except Exception:
+            try:
+                # Entry written by the pickle fallback below
+                return pd.read_pickle(path)
+            except Exception:
+                return None
+
+    def _cache_store(self, path: str, df: pd.DataFrame) -> None:
+        """
+        Persist a downloaded DataFrame to the on-disk cache.
+
+        Args:
+            path: Cache file path from _cache_path
+            df: Downloaded data to persist
+        """
+        if not self.cache_enabled or df is None or df.empty:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            try:
+                df.to_parquet(path)
+            except Exception:
+                # No parquet engine installed: pickle still beats refetching
+                df.to_pickle(path)
+        except Exception:
+            # Cache writes are best-effort; never fail the fetch
+            pass
+
+
     def fetch_historical(self,
                         symbols: List[str],
                         lookback_days: int = 1260,
@@ -47,9 +145,17 @@ class DataFetcher:
             end_date = datetime.now()
         if start_date is None:
             start_date = end_date - timedelta(days=lookback_days)
-        
+
+        cache_path = self._cache_path(
+            'historical', tuple(sorted(symbols)),
+            self._date_key(start_date), self._date_key(end_date), '1d')
+        cached = self._cache_load(cache_path)
+        if cached is not None:
+            self.data_cache['prices'] = cached
+            return cached
+
         print(f"📡 Fetching data for {len(symbols)} symbols from {start_date.date() if isinstance(start_date, datetime) else start_date} to {end_date.date() if isinstance(end_date, datetime) else end_date}...")
-        
+
         data = yf.download(
             symbols,
             start=start_date,
@@ -72,6 +178,7 @@ class DataFetcher:
             prices['symbol'] = symbols[0]
             prices = prices.set_index('symbol', append=True)
         
+        self._cache_store(cache_path, prices)
         self.data_cache['prices'] = prices
         return prices
     
@@ -97,8 +204,19 @@ class DataFetcher:
         else:
             prices_wide = price_df
         
-        # Log returns
-        returns = np.log(prices_wide / prices_wide.shift(1)).dropna()
+        # Log returns: diff of log prices on the raw array. The log runs
+        # in place on an owned copy and the subtract writes straight
+        # into the result buffer, so the whole computation allocates
+        # exactly two arrays (vs the five-frame divide/shift/log chain)
+        log_prices = prices_wide.to_numpy(dtype=np.float64, copy=True)
+        np.log(log_prices, out=log_prices)
+        diffs = np.subtract(log_prices[1:], log_prices[:-1],
+                            out=np.empty_like(log_prices[1:]))
+        returns = pd.DataFrame(
+            diffs,
+            index=prices_wide.index[1:],
+            columns=prices_wide.columns
+        ).dropna()
         
         self.data_cache['returns'] = returns
         return returns
@@ -139,31 +257,130 @@ class DataFetcher:
         Returns:
             DataFrame with adjusted close prices
         """
-        if start_date is None and end_date is None:
-            data = yf.download(tickers, period=period, progress=False)
+        cache_path = self._cache_path(
+            'stocks', tuple(sorted(tickers)), str(start_date), str(end_date), period)
+        cached = self._cache_load(cache_path)
+        if cached is not None:
+            return cached
+
+        def download(chunk: List[str]) -> pd.DataFrame:
+            fast = self._chart_download(chunk, start_date, end_date, period)
+            if fast is not None:
+                return fast
+            if start_date is None and end_date is None:
+                data = yf.download(chunk, period=period, progress=False)
+            else:
+                data = yf.download(chunk, start=start_date, end=end_date, progress=False)
+            return self._extract_prices(data, chunk)
+
+        # The download is pure I/O, so large universes are split into
+        # chunks fetched concurrently; wall time scales with the slowest
+        # chunk instead of the sum of all requests
+        chunk_size = 20
+        if len(tickers) > chunk_size:
+            chunks = [tickers[i:i + chunk_size]
+                      for i in range(0, len(tickers), chunk_size)]
+            try:
+                with ThreadPoolExecutor(max_workers=min(16, len(chunks))) as pool:
+                    frames = list(pool.map(download, chunks))
+                prices = pd.concat(frames, axis=1)
+            except Exception:
+                # Any chunk failure: retry as one sequential request
+                prices = download(tickers)
         else:
-            data = yf.download(tickers, start=start_date, end=end_date, progress=False)
-        
-        # Handle different return structures from yfinance
+            prices = download(tickers)
+
+        self._cache_store(cache_path, prices)
+        return prices
+
+    def _chart_download(self,
+                        symbols: List[str],
+                        start_date,
+                        end_date,
+                        period: str = '1y',
+                        interval: str = '1d') -> Optional[pd.DataFrame]:
+        """
+        Fetch adjusted closes straight from Yahoo's v8 chart endpoint.
+
+        One JSON GET per symbol over a shared session, bypassing
+        yfinance's scraping and cookie handling. Requires the optional
+        curl_cffi package; any error returns None so callers fall back
+        to yf.download.
+
+        Args:
+            symbols: Ticker symbols
+            start_date: Start date, or None to use period
+            end_date: End date, or None to use period
+            period: Range string when dates are not given
+            interval: Bar interval
+
+        Returns:
+            Wide price DataFrame (date x symbols), or None on failure
+        """
+        if not HAS_CURL:
+            return None
+
+        try:
+            if self._chart_session is None:
+                self._chart_session = curl_requests.Session(impersonate='chrome')
+
+            params = {'interval': interval, 'events': 'div,splits'}
+            if start_date is None and end_date is None:
+                params['range'] = period
+            else:
+                params['period1'] = int(pd.Timestamp(start_date).timestamp())
+                params['period2'] = int(pd.Timestamp(end_date).timestamp())
+
+            series = {}
+            for symbol in symbols:
+                resp = self._chart_session.get(
+                    _CHART_URL.format(symbol=symbol), params=params, timeout=10)
+                result = resp.json()['chart']['result'][0]
+                closes = result['indicators']['adjclose'][0]['adjclose']
+                # Chart timestamps are intraday epochs (market open);
+                # normalize to midnight so frames align with yf.download
+                # dates when fetch_stocks concatenates mixed chunks
+                series[symbol] = pd.Series(
+                    closes,
+                    index=pd.to_datetime(
+                        result['timestamp'], unit='s').normalize())
+
+            return pd.DataFrame(series)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _extract_prices(data: pd.DataFrame, tickers: List[str]) -> pd.DataFrame:
+        """
+        Normalize a yf.download result to a wide adjusted-close frame.
+
+        Args:
+            data: Raw yfinance download result
+            tickers: Tickers requested for this download
+
+        Returns:
+            DataFrame of prices (date x tickers)
+        """
+        # No defensive copies: the download result is request-local, and
+        # rename returns a new frame over the same buffers. Downstream
+        # diff/pct_change allocate their own output arrays.
         if len(tickers) == 1:
             # Single ticker returns simple DataFrame
             if 'Adj Close' in data.columns:
-                prices = data[['Adj Close']].copy()
-                prices.columns = [tickers[0]]
+                prices = data[['Adj Close']].rename(columns={'Adj Close': tickers[0]})
             else:
-                prices = data[['Close']].copy()
-                prices.columns = [tickers[0]]
+                prices = data[['Close']].rename(columns={'Close': tickers[0]})
         else:
             # Multiple tickers returns MultiIndex DataFrame
             if isinstance(data.columns, pd.MultiIndex):
                 if 'Adj Close' in data.columns.get_level_values(0):
-                    prices = data['Adj Close'].copy()
+                    prices = data['Adj Close']
                 else:
-                    prices = data['Close'].copy()
+                    prices = data['Close']
             else:
                 # Fallback: assume it's already the right format
-                prices = data.copy()
-        
+                prices = data
+
         return prices
     
     def fetch_returns(self,
@@ -188,9 +405,11 @@ class DataFetcher:
         prices = self.fetch_stocks(tickers, start_date, end_date, period)
         
         if log_returns:
-            returns = np.log(prices / prices.shift(1))
+            # diff of log prices: half the temporaries of log(p / p.shift(1))
+            returns = np.log(prices).diff()
         else:
-            returns = prices.pct_change()
+            # Explicit fill_method avoids pandas' implicit ffill pass
+            returns = prices.pct_change(fill_method=None)
         
         # Drop NaN values
         returns = returns.dropna()
@@ -12,18 +12,24 @@ class DataPreprocessor:
     Clean and preprocess market data.
     """
     
-    def __init__(self, 
+    def __init__(self,
                  max_missing: float = 0.1,
-                 outlier_threshold: float = 5.0):
+                 outlier_threshold: float = 5.0,
+                 float32: bool = False):
         """
         Initialize preprocessor.
-        
+
         Args:
             max_missing: Maximum fraction of missing data allowed
             outlier_threshold: Standard deviations for outlier detection
+            float32: Downcast cleaned returns to float32 (halves memory
+                     traffic downstream; daily returns carry ~4
+                     significant digits, well within fp32)
         """
         self.max_missing = max_missing
         self.outlier_threshold = outlier_threshold
+        self.float32 = float32
+        self._align_cache = {}  # (index ids) -> (indexes, common index)
     
     def clean_returns(self, returns: pd.DataFrame) -> pd.DataFrame:
         """
@@ -36,15 +42,21 @@ class DataPreprocessor:
             Cleaned returns DataFrame
         """
         # TODO: Implement full cleaning pipeline in later chunks
-        
-        # Remove columns with too much missing data
-        missing_fraction = returns.isna().sum() / len(returns)
-        valid_columns = missing_fraction[missing_fraction < self.max_missing].index
-        returns_clean = returns[valid_columns].copy()
-        
-        # Forward fill remaining NaN values
-        returns_clean = returns_clean.fillna(method='ffill').fillna(0)
-        
+
+        # Remove columns with too much missing data: one SIMD isnan
+        # pass over the raw buffer instead of the isna/sum Series chain
+        nan_fraction = np.isnan(returns.to_numpy(dtype=np.float64)).mean(axis=0)
+        returns_clean = returns.loc[:, returns.columns[nan_fraction < self.max_missing]]
+
+        # Forward fill remaining NaN values (.ffill avoids the
+        # deprecated fillna(method=...) path); ffill already returns a
+        # new frame, so the second fill can run in place
+        returns_clean = returns_clean.ffill()
+        returns_clean.fillna(0.0, inplace=True)
+
+        if self.float32:
+            returns_clean = returns_clean.astype(np.float32, copy=False)
+
         return returns_clean
     
     def remove_outliers(self, returns: pd.DataFrame) -> pd.DataFrame:
@@ -58,17 +70,14 @@ class DataPreprocessor:
             Returns with outliers handled
         """
         # TODO: Implement robust outlier handling in later chunks
-        
-        # Placeholder: cap at threshold * std
-        returns_clean = returns.copy()
-        for col in returns_clean.columns:
-            mean = returns_clean[col].mean()
-            std = returns_clean[col].std()
-            upper = mean + self.outlier_threshold * std
-            lower = mean - self.outlier_threshold * std
-            returns_clean[col] = returns_clean[col].clip(lower, upper)
-        
-        return returns_clean
+
+        # Cap at threshold * std, all columns at once: two vectorized
+        # reductions plus one fused clip instead of per-column Series
+        # mean/std/clip dispatch
+        mean = returns.mean()
+        std = returns.std()
+        k = self.outlier_threshold
+        return returns.clip(lower=mean - k * std, upper=mean + k * std, axis=1)
     
     def align_data(self, *dataframes: pd.DataFrame) -> Tuple[pd.DataFrame, ...]:
         """
@@ -80,12 +89,33 @@ class DataPreprocessor:
         Returns:
             Tuple of aligned DataFrames
         """
-        # Find common dates
-        common_index = dataframes[0].index
-        for df in dataframes[1:]:
-            common_index = common_index.intersection(df.index)
-        
-        # Align all dataframes
-        aligned = tuple(df.loc[common_index] for df in dataframes)
-        
+        # Common case in backtesting: all frames already share the same
+        # index — return them untouched, zero copies
+        first_index = dataframes[0].index
+        if all(df.index.equals(first_index) for df in dataframes[1:]):
+            return dataframes
+
+        # Parameter sweeps re-align the same frames many times; pandas
+        # indexes are immutable, so the intersection can be memoized by
+        # object identity. The cached index tuple keeps the sources
+        # alive, which makes the id-based key safe from reuse.
+        key = tuple(id(df.index) for df in dataframes)
+        cached = self._align_cache.get(key)
+        if cached is not None and all(
+                a is b.index for a, b in zip(cached[0], dataframes)):
+            common_index = cached[1]
+        else:
+            # Find common dates
+            common_index = first_index
+            for df in dataframes[1:]:
+                common_index = common_index.intersection(df.index)
+
+            if len(self._align_cache) > 8:
+                self._align_cache.clear()
+            self._align_cache[key] = (tuple(df.index for df in dataframes),
+                                      common_index)
+
+        # Align all dataframes; reindex skips the copy .loc always makes
+        aligned = tuple(df.reindex(common_index, copy=False) for df in dataframes)
+
         return aligned
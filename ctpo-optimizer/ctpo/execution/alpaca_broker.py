@@ -27,6 +27,7 @@ class MockAlpacaBroker:
         self.paper = paper
         self.connected = False
         self.positions = {}
+        self._positions_view = None  # Cached get_positions result
         self.orders = []
         self.account = {
             'cash': 100000.0,
@@ -101,7 +102,8 @@ class MockAlpacaBroker:
             self.positions[symbol] = current_qty + qty
         else:
             self.positions[symbol] = current_qty - qty
-        
+        self._positions_view = None
+
         return order
     
     def get_positions(self) -> List[Dict]:
@@ -111,11 +113,15 @@ class MockAlpacaBroker:
         Returns:
             List of mock positions
         """
-        return [
-            {'symbol': symbol, 'qty': qty, 'market_value': qty * 100.0}
-            for symbol, qty in self.positions.items()
-            if qty != 0
-        ]
+        # Rebuilt only after an order or close; backtests that poll
+        # positions every step otherwise re-allocate N dicts per call
+        if self._positions_view is None:
+            self._positions_view = [
+                {'symbol': symbol, 'qty': qty, 'market_value': qty * 100.0}
+                for symbol, qty in self.positions.items()
+                if qty != 0
+            ]
+        return list(self._positions_view)
     
     def close_position(self, symbol: str) -> bool:
         """
@@ -129,6 +135,7 @@ class MockAlpacaBroker:
         """
         if symbol in self.positions:
             del self.positions[symbol]
+            self._positions_view = None
             logger.info(f"[MOCK] Closed position: {symbol}")
             return True
         return False
@@ -3,6 +3,10 @@ Live trading system for real-time portfolio optimization
 """
 
 import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 import yfinance as yf
 import pandas as pd
 import numpy as np
@@ -10,6 +14,29 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import logging
 
+from ctpo.core.optimizer import CTPOOptimizer
+from ctpo.risk.risk_model import RiskModel
+from ctpo.metrics.performance import PerformanceMetrics
+
+try:
+    # Optional fast path: Yahoo's spark endpoint returns batched quotes
+    # in one JSON GET, without yfinance's thread pool or frame parsing
+    from curl_cffi import requests as curl_requests
+    HAS_CURL = True
+except ImportError:
+    HAS_CURL = False
+
+try:
+    # Optional: stream the performance log to parquet as it is written
+    # instead of materializing one big frame at shutdown
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+_SPARK_URL = 'https://query1.finance.yahoo.com/v8/finance/spark'
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -40,10 +67,6 @@ class LiveTradingSystem:
         self.lookback_periods = lookback_periods
         
         # Initialize components
-        from ctpo.core.optimizer import CTPOOptimizer
-        from ctpo.risk.risk_model import RiskModel
-        from ctpo.metrics.performance import PerformanceMetrics
-        
         self.optimizer = CTPOOptimizer()
         self.risk_model = RiskModel()
         self.metrics = PerformanceMetrics()
@@ -51,14 +74,59 @@ class LiveTradingSystem:
         # State tracking
         self.current_weights = np.ones(self.n_assets) / self.n_assets
         self.current_prices = np.zeros(self.n_assets)
-        self.returns_buffer = []
-        self.trade_log = []
+        # Returns history lives in a preallocated ring buffer: one flat
+        # contiguous float64 matrix with modular writes, instead of a
+        # growing list of per-cycle dicts that had to be unboxed into
+        # an array on every rebalance
+        self._ring = np.empty((lookback_periods, self.n_assets))
+        self._ring_head = 0
+        self._ring_len = 0
+        # Running first/second moments of the ring contents, maintained
+        # by adding each new row's outer product and subtracting the
+        # evicted one's — the sample covariance then costs O(N^2) per
+        # cycle instead of an O(T*N^2) rebuild
+        self._cov_sum = np.zeros(self.n_assets)
+        self._cov_cross = np.zeros((self.n_assets, self.n_assets))
+        # The full GARCH/stress pipeline scans the whole window, so it
+        # runs only every risk_refresh-th rebalance; in between, Sigma
+        # is rebuilt from the incremental moments against the cached
+        # stress state
+        self.risk_refresh = 5
+        self._risk_cache = None
+        self._rebalances_since_risk = 0
+        # Trades stream to an append-only structured memmap (fixed
+        # binary layout: ns timestamp, turnover, solve ms, weights
+        # vector) so persistence is a row assignment per rebalance and
+        # memory stays constant; the in-memory log keeps only a recent
+        # tail for reporting
+        self.trade_log = deque(maxlen=256)
+        self._trade_mm = None
+        self._trade_path = None
+        self._trade_count = 0
         self.performance_log = []
+        # Streaming parquet writer for the performance log: rows are
+        # buffered in small batches and appended during the run, so
+        # shutdown only closes the file instead of serializing the
+        # whole history at once
+        self._perf_writer = None
+        self._perf_path = None
+        self._perf_rows = []
         
         # Control flags
         self.running = False
         self.last_rebalance = None
         self.rebalance_cooldown = 300  # 5 minutes between rebalances
+        # Cooldown gate state: the per-cycle check is one integer
+        # compare against a monotonic deadline, and gate decisions are
+        # only logged when they change
+        self._next_rebalance_ns = 0
+        self._gate_state = None
+
+        # Spark fast-path state: symbol -> buffer slot, preallocated
+        # price buffer, lazily created HTTP session
+        self._symbol_idx = {s: i for i, s in enumerate(symbols)}
+        self._spark_buf = np.empty(self.n_assets)
+        self._spark_session = None
         
         logger.info(f"🚀 LiveTradingSystem initialized")
         logger.info(f"   Symbols: {', '.join(symbols)}")
@@ -74,6 +142,18 @@ class LiveTradingSystem:
         """
         self.running = True
         start_time = datetime.now()
+
+        # Bound the pool behind asyncio.to_thread: the default executor
+        # sizes itself to cpu_count+4 threads, more than the blocking
+        # yfinance fallback ever needs
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=16))
+
+        # Open the shared HTTP session up front: it lives for the whole
+        # run, so every cycle reuses the pooled TLS connection instead
+        # of paying a handshake per fetch
+        if HAS_CURL and self._spark_session is None:
+            self._spark_session = curl_requests.AsyncSession(impersonate='chrome')
         
         logger.info(f"\n{'='*70}")
         logger.info(f"▶️  Starting live trading at {start_time}")
@@ -114,67 +194,190 @@ class LiveTradingSystem:
             self.running = False
             await self._shutdown()
     
+    def _chunk_symbols(self) -> list:
+        """Split the symbol universe into spark-sized batches (max 20 per URL)."""
+        return [self.symbols[i:i + 20]
+                for i in range(0, len(self.symbols), 20)]
+
+    async def _fetch_spark(self) -> Optional[np.ndarray]:
+        """
+        Fetch latest prices from Yahoo's spark endpoint.
+
+        Batches up to 20 symbols per GET over a shared async session
+        and writes the closes into the preallocated buffer — no thread
+        pool, no DataFrame construction, and the event loop keeps
+        running while requests are in flight. Any failure returns None
+        so the caller falls back to yf.download.
+
+        Returns:
+            Latest prices aligned to self.symbols, or None
+        """
+        if not HAS_CURL:
+            return None
+
+        try:
+            if self._spark_session is None:
+                self._spark_session = curl_requests.AsyncSession(impersonate='chrome')
+
+            responses = await asyncio.gather(*[
+                self._spark_session.get(
+                    _SPARK_URL,
+                    params={'symbols': ','.join(chunk),
+                            'range': '1d', 'interval': '1d'},
+                    timeout=10)
+                for chunk in self._chunk_symbols()])
+
+            filled = 0
+            for resp in responses:
+                for result in resp.json()['spark']['result']:
+                    closes = result['response'][0]['indicators']['quote'][0]['close']
+                    close = next(c for c in reversed(closes) if c is not None)
+                    self._spark_buf[self._symbol_idx[result['symbol']]] = close
+                    filled += 1
+
+            if filled != self.n_assets:
+                return None
+            return self._spark_buf.copy()
+        except Exception:
+            return None
+
     async def _update_market_data(self):
         """Fetch latest prices and update returns buffer."""
         try:
-            # Fetch recent data
-            data = yf.download(
-                self.symbols,
-                period='5d',
-                interval='1d',
-                progress=False
-            )
-            
-            if data.empty:
-                logger.warning("⚠️  No data received")
-                return
-            
-            # Extract latest prices
-            if len(self.symbols) > 1:
-                if isinstance(data.columns, pd.MultiIndex):
-                    latest_prices = data['Adj Close'].iloc[-1].values
+            latest_prices = await self._fetch_spark()
+
+            if latest_prices is None:
+                # Fallback: yfinance in a worker thread so the blocking
+                # download does not stall the event loop
+                data = await asyncio.to_thread(
+                    yf.download,
+                    self.symbols,
+                    period='5d',
+                    interval='1d',
+                    progress=False
+                )
+
+                if data.empty:
+                    logger.warning("⚠️  No data received")
+                    return
+
+                # Extract latest prices
+                if len(self.symbols) > 1:
+                    if isinstance(data.columns, pd.MultiIndex):
+                        latest_prices = data['Adj Close'].iloc[-1].values
+                    else:
+                        latest_prices = data['Adj Close'].values
                 else:
-                    latest_prices = data['Adj Close'].values
-            else:
-                latest_prices = np.array([data['Adj Close'].iloc[-1]])
+                    latest_prices = np.array([data['Adj Close'].iloc[-1]])
             
             # Calculate returns if we have previous prices
             if not np.all(self.current_prices == 0):
                 returns = (latest_prices - self.current_prices) / self.current_prices
-                
-                self.returns_buffer.append({
-                    'timestamp': datetime.now(),
-                    'returns': returns,
-                    'prices': latest_prices
-                })
-                
-                # Keep only recent history
-                if len(self.returns_buffer) > self.lookback_periods:
-                    self.returns_buffer.pop(0)
-                
-                logger.info(f"   Market data updated: {len(self.returns_buffer)} periods")
+
+                # Keep the running moments in sync with the ring: once
+                # the buffer is full, the row about to be overwritten
+                # leaves the window and its contributions come off first
+                if self._ring_len == self.lookback_periods:
+                    evicted = self._ring[self._ring_head]
+                    self._cov_sum -= evicted
+                    self._cov_cross -= np.outer(evicted, evicted)
+                self._cov_sum += returns
+                self._cov_cross += np.outer(returns, returns)
+
+                # Modular write into the ring; old rows age out for free
+                self._ring[self._ring_head] = returns
+                self._ring_head = (self._ring_head + 1) % self.lookback_periods
+                self._ring_len = min(self._ring_len + 1, self.lookback_periods)
+
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"   Market data updated: {self._ring_len} periods")
             
             self.current_prices = latest_prices
             
         except Exception as e:
             logger.error(f"❌ Error fetching market data: {e}")
     
+    def _returns_window(self) -> np.ndarray:
+        """
+        Return the buffered returns oldest-first as one ndarray.
+
+        Zero-copy while the ring has not wrapped; after wrapping, one
+        concatenate restores chronological order.
+
+        Returns:
+            Returns matrix (ring_len x n_assets)
+        """
+        if self._ring_len < self.lookback_periods or self._ring_head == 0:
+            return self._ring[:self._ring_len]
+        return np.concatenate((self._ring[self._ring_head:],
+                               self._ring[:self._ring_head]))
+
+    def _incremental_covariance(self) -> np.ndarray:
+        """
+        Sample covariance of the buffered returns from the running moments.
+
+        Equivalent (up to floating-point rounding) to np.cov over the
+        full window, but O(N^2) regardless of window length.
+
+        Returns:
+            Covariance matrix (n_assets x n_assets)
+        """
+        t = self._ring_len
+        s = self._cov_sum
+        return (self._cov_cross - np.outer(s, s) / t) / (t - 1)
+
+    def _serve_cached_risk(self) -> Dict:
+        """
+        Build risk inputs from the cached stress state plus fresh moments.
+
+        GARCH volatilities, market volatility, betas and expected
+        returns move slowly between rebalances and are reused from the
+        last full update; only the correlation structure is refreshed —
+        from the incremental sample covariance — and re-stressed at the
+        cached market volatility. Everything here is O(N^2).
+
+        Returns:
+            Risk dictionary with the same keys as RiskModel.update
+        """
+        cached = self._risk_cache
+        cov = self._incremental_covariance()
+        std = np.sqrt(np.clip(np.diag(cov), 1e-12, None))
+        corr = cov / np.outer(std, std)
+
+        P_stress, alpha = self.risk_model.stress_corr.apply_stress(
+            correlation=corr, sigma_market=cached['sigma_market'])
+        D = np.diag(cached['volatilities'])
+        Sigma = self.risk_model.stress_corr.condition_covariance(
+            D @ P_stress @ D)
+
+        risk_update = dict(cached)
+        risk_update['Sigma'] = Sigma
+        risk_update['alpha_stress'] = alpha
+        return risk_update
+
     def _should_rebalance(self) -> bool:
         """Determine if portfolio should be rebalanced."""
         # Need sufficient data
-        if len(self.returns_buffer) < 50:
-            logger.info(f"   Insufficient data: {len(self.returns_buffer)}/50")
+        if self._ring_len < 50:
+            self._log_gate('data', f"   Insufficient data: {self._ring_len}/50")
             return False
-        
-        # Respect cooldown period
-        if self.last_rebalance:
-            seconds_since = (datetime.now() - self.last_rebalance).total_seconds()
-            if seconds_since < self.rebalance_cooldown:
-                logger.info(f"   Cooldown active: {seconds_since:.0f}s / {self.rebalance_cooldown}s")
-                return False
-        
-        logger.info("   ✅ Ready to rebalance")
+
+        # Respect cooldown period: one integer compare against a
+        # monotonic deadline instead of two datetime.now() calls per
+        # cycle, and immune to wall-clock adjustments
+        if time.monotonic_ns() < self._next_rebalance_ns:
+            self._log_gate('cooldown',
+                           f"   Cooldown active: {self.rebalance_cooldown}s between rebalances")
+            return False
+
+        self._log_gate('ready', "   ✅ Ready to rebalance")
         return True
+
+    def _log_gate(self, state: str, message: str):
+        """Log a rebalance-gate decision only when the state changes."""
+        if state != self._gate_state:
+            self._gate_state = state
+            logger.info(message)
     
     async def _rebalance_portfolio(self):
         """Execute portfolio rebalancing."""
@@ -183,31 +386,48 @@ class LiveTradingSystem:
             logger.info("⚖️  REBALANCING PORTFOLIO")
             logger.info(f"{'='*70}")
             
-            # 1. Prepare returns dataframe
-            returns_data = [r['returns'] for r in self.returns_buffer]
-            returns_df = pd.DataFrame(returns_data, columns=self.symbols)
-            
-            logger.info(f"   Using {len(returns_df)} periods of data")
+            # 1. Chronological ring view, passed around as the raw
+            # array — no per-cycle DataFrame build
+            returns_arr = self._returns_window()
+
+            logger.info(f"   Using {returns_arr.shape[0]} periods of data")
             
-            # 2. Update risk model
-            risk_update = self.risk_model.update(returns_df, market_return=0.10)
+            # 2. Update risk model — the full window-length pipeline on
+            # every risk_refresh-th rebalance, the O(N^2) cached path in
+            # between
+            if (self._risk_cache is None
+                    or self._rebalances_since_risk >= self.risk_refresh):
+                risk_update = self.risk_model.update(
+                    returns_arr, market_return=0.10, symbols=self.symbols)
+                self._risk_cache = risk_update
+                self._rebalances_since_risk = 0
+                # Re-sync the running moments from the window to clear
+                # accumulated add/subtract rounding drift
+                window = self._returns_window()
+                self._cov_sum = window.sum(axis=0)
+                self._cov_cross = window.T @ window
+            else:
+                risk_update = self._serve_cached_risk()
+                self._rebalances_since_risk += 1
             
             logger.info(f"   Market Vol: {risk_update['sigma_market']:.3f}")
             logger.info(f"   Stress Level (α): {risk_update['alpha_stress']:.3f}")
             logger.info(f"   Avg Correlation: {risk_update['avg_correlation']:.3f}")
             
             # 3. Run optimization
-            tic = datetime.now()
-            market_returns = returns_df.mean(axis=1).values
-            
+            # Monotonic ns counter: sub-ms resolution for solve timing,
+            # no datetime allocation
+            tic = time.perf_counter_ns()
+            market_returns = returns_arr.mean(axis=1)
+
             target_weights = self.optimizer.optimize(
-                returns_df.values,
+                returns_arr,
                 covariance=risk_update['Sigma'],
                 expected_returns=risk_update['mu'],
                 market_returns=market_returns
             )
             
-            solve_time = (datetime.now() - tic).total_seconds() * 1000
+            solve_time = (time.perf_counter_ns() - tic) * 1e-6
             metrics = self.optimizer.get_metrics()
             
             logger.info(f"   Solve Time: {solve_time:.1f} ms")
@@ -216,59 +436,166 @@ class LiveTradingSystem:
             # 4. Calculate trades
             weight_changes = target_weights - self.current_weights
             total_turnover = np.sum(np.abs(weight_changes))
-            
-            logger.info(f"\n   Portfolio Changes (turnover: {total_turnover:.2%}):")
-            for i, symbol in enumerate(self.symbols):
-                if abs(weight_changes[i]) > 0.01:  # 1% threshold
-                    logger.info(f"     {symbol:6s}: {self.current_weights[i]:>6.2%} → "
-                              f"{target_weights[i]:>6.2%} ({weight_changes[i]:>+6.2%})")
+
+            # Formatting every row costs more than the rebalance math
+            # for large universes; build the report only when the sink
+            # is enabled, and emit it as a single record
+            if logger.isEnabledFor(logging.INFO):
+                mask = np.abs(weight_changes) > 0.01  # 1% threshold
+                lines = [f"\n   Portfolio Changes (turnover: {total_turnover:.2%}):"]
+                lines += [
+                    f"     {symbol:6s}: {old:>6.2%} → {new:>6.2%} ({chg:>+6.2%})"
+                    for symbol, old, new, chg in zip(
+                        np.asarray(self.symbols)[mask],
+                        self.current_weights[mask],
+                        target_weights[mask],
+                        weight_changes[mask])
+                ]
+                logger.info("\n".join(lines))
             
             # 5. Update weights (simulation mode)
             self.current_weights = target_weights
             
-            # 6. Log trade
+            # 6. Log trade: tail dict for reporting, binary row on disk
             self.trade_log.append({
                 'timestamp': datetime.now(),
                 'weights': target_weights.copy(),
                 'turnover': total_turnover,
                 'solve_time_ms': solve_time
             })
+            self._record_trade(target_weights, total_turnover, solve_time)
             
             self.last_rebalance = datetime.now()
+            self._next_rebalance_ns = (time.monotonic_ns()
+                                       + self.rebalance_cooldown * 1_000_000_000)
             logger.info("✅ Rebalancing complete\n")
             
         except Exception as e:
             logger.error(f"❌ Rebalancing failed: {e}", exc_info=True)
     
+    def _record_trade(self, weights: np.ndarray, turnover: float, solve_ms: float):
+        """
+        Append one trade row to the memmapped binary log.
+
+        A structured-row assignment persists the trade immediately at
+        fixed cost; failures never interrupt the trading loop.
+        """
+        try:
+            if self._trade_mm is None or self._trade_count == self._trade_mm.shape[0]:
+                self._grow_trade_log()
+            row = self._trade_mm[self._trade_count]
+            row['ts'] = time.time_ns()
+            row['turnover'] = turnover
+            row['solve_ms'] = solve_ms
+            row['weights'] = weights
+            self._trade_count += 1
+        except Exception as e:
+            logger.error(f"❌ Failed to write trade log: {e}")
+
+    def _grow_trade_log(self):
+        """Create the memmapped trade log, doubling capacity when full."""
+        dtype = np.dtype([
+            ('ts', '<i8'),
+            ('turnover', '<f8'),
+            ('solve_ms', '<f8'),
+            ('weights', '<f8', (self.n_assets,)),
+        ])
+        if self._trade_path is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            self._trade_path = f'trade_log_{timestamp}.npy'
+        # open_memmap truncates, so carry the written rows across the
+        # resize (doubling keeps this amortized-constant per trade)
+        existing = None
+        capacity = 1024
+        if self._trade_mm is not None:
+            existing = np.array(self._trade_mm[:self._trade_count])
+            capacity = 2 * self._trade_mm.shape[0]
+        self._trade_mm = np.lib.format.open_memmap(
+            self._trade_path, mode='w+', dtype=dtype, shape=(capacity,))
+        if existing is not None:
+            self._trade_mm[:self._trade_count] = existing
+
     def _calculate_portfolio_return(self) -> float:
         """Calculate current portfolio return."""
-        if len(self.returns_buffer) < 2:
+        if self._ring_len < 2:
             return 0.0
-        
-        returns = np.array([r['returns'] for r in self.returns_buffer])
-        portfolio_returns = returns @ self.current_weights
-        
+
+        portfolio_returns = self._returns_window() @ self.current_weights
+
         return np.sum(portfolio_returns)
-    
+
     def _log_performance(self):
         """Log current performance metrics."""
-        if len(self.returns_buffer) < 2:
+        if self._ring_len < 2:
             return
         
         portfolio_return = self._calculate_portfolio_return()
         portfolio_value = self.capital * (1 + portfolio_return)
         
-        self.performance_log.append({
+        entry = {
             'timestamp': datetime.now(),
             'value': portfolio_value,
             'return': portfolio_return,
             'weights': self.current_weights.copy()
-        })
-        
-        logger.info(f"   💰 Portfolio: ${portfolio_value:,.2f} ({portfolio_return:+.2%})")
+        }
+        self.performance_log.append(entry)
+        self._append_perf_row(entry)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"   💰 Portfolio: ${portfolio_value:,.2f} ({portfolio_return:+.2%})")
+
+    def _append_perf_row(self, entry: Dict):
+        """
+        Queue a performance entry for the streaming parquet log.
+
+        Rows are flushed in batches of 64 to keep row groups reasonable;
+        writes are best-effort and never interrupt the trading loop.
+        """
+        if not HAS_PYARROW:
+            return
+        self._perf_rows.append(entry)
+        if len(self._perf_rows) >= 64:
+            self._flush_perf_rows()
+
+    def _flush_perf_rows(self):
+        """Append buffered performance rows to the parquet log."""
+        if not self._perf_rows:
+            return
+        try:
+            if self._perf_writer is None:
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                self._perf_path = f'performance_log_{timestamp}.parquet'
+                self._perf_schema = pa.schema([
+                    ('timestamp', pa.timestamp('us')),
+                    ('value', pa.float64()),
+                    ('return', pa.float64()),
+                    ('weights', pa.list_(pa.float64())),
+                ])
+                self._perf_writer = pq.ParquetWriter(
+                    self._perf_path, self._perf_schema)
+
+            rows = self._perf_rows
+            table = pa.table({
+                'timestamp': [r['timestamp'] for r in rows],
+                'value': [r['value'] for r in rows],
+                'return': [r['return'] for r in rows],
+                'weights': [r['weights'] for r in rows],
+            }, schema=self._perf_schema)
+            self._perf_writer.write_table(table)
+            self._perf_rows = []
+        except Exception as e:
+            logger.error(f"❌ Failed to write performance log: {e}")
+            self._perf_rows = []
     
     async def _shutdown(self):
         """Clean shutdown and final report."""
+        if self._spark_session is not None:
+            try:
+                await self._spark_session.close()
+            except Exception:
+                pass
+            self._spark_session = None
+
         logger.info(f"\n{'='*70}")
         logger.info("🛑 SHUTTING DOWN LIVE TRADING SYSTEM")
         logger.info(f"{'='*70}\n")
@@ -284,7 +611,7 @@ class LiveTradingSystem:
             logger.info(f"Final Performance:")
             logger.info(f"  Portfolio Value: ${final_value:,.2f}")
             logger.info(f"  Total Return: {final_return:+.2%}")
-            logger.info(f"  Total Trades: {len(self.trade_log)}")
+            logger.info(f"  Total Trades: {max(self._trade_count, len(self.trade_log))}")
             
             # Save logs
             self._save_logs()
@@ -296,15 +623,28 @@ class LiveTradingSystem:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         try:
-            # Save performance log
-            if self.performance_log:
+            # Save performance log: with the streaming writer, the data
+            # is already on disk — flush the tail batch and close
+            if self._perf_writer is not None or self._perf_rows:
+                self._flush_perf_rows()
+                if self._perf_writer is not None:
+                    self._perf_writer.close()
+                    self._perf_writer = None
+                    logger.info(f"   💾 Performance log saved: {self._perf_path}")
+            elif self.performance_log:
                 perf_df = pd.DataFrame(self.performance_log)
                 filename = f'performance_log_{timestamp}.csv'
                 perf_df.to_csv(filename, index=False)
                 logger.info(f"   💾 Performance log saved: {filename}")
             
-            # Save trade log
-            if self.trade_log:
+            # Save trade log: rows are already on disk; compact the
+            # preallocated file down to the rows actually written
+            if self._trade_mm is not None:
+                rows = np.array(self._trade_mm[:self._trade_count])
+                self._trade_mm = None
+                np.save(self._trade_path, rows)
+                logger.info(f"   💾 Trade log saved: {self._trade_path}")
+            elif self.trade_log:
                 trade_df = pd.DataFrame(self.trade_log)
                 filename = f'trade_log_{timestamp}.csv'
                 trade_df.to_csv(filename, index=False)
@@ -330,6 +670,14 @@ def run_paper_trading(symbols: List[str],
         initial_capital=initial_capital,
         update_interval=60  # 1 minute for testing
     )
-    
+
+    # Prefer uvloop when installed: lower event-dispatch overhead for
+    # the many small HTTP requests and sleep timers per cycle
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     # Run async loop
     asyncio.run(system.start(duration_hours=duration_hours))
@@ -4,7 +4,7 @@ Paper trading simulator
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 from datetime import datetime
 
 
@@ -12,55 +12,77 @@ class PaperTrader:
     """
     Simulated paper trading for live testing.
     """
-    
+
     def __init__(self,
                  initial_capital: float = 1000000.0,
-                 transaction_cost: float = 0.001):
+                 transaction_cost: float = 0.001,
+                 tickers: Optional[List[str]] = None):
         """
         Initialize paper trader.
-        
+
         Args:
             initial_capital: Starting capital
             transaction_cost: Cost per trade (fraction)
+            tickers: Trading universe. Positions are held in a flat
+                     int array indexed by ticker id, so portfolio
+                     valuation is one dot product instead of a dict
+                     walk; tickers outside the initial universe are
+                     appended on first trade.
         """
         self.initial_capital = initial_capital
         self.current_capital = initial_capital
         self.transaction_cost = transaction_cost
-        self.positions = {}
+        self._ticker_index = {t: i for i, t in enumerate(tickers)} if tickers else {}
+        self._positions = np.zeros(len(self._ticker_index), dtype=np.int64)
         self.trade_history = []
-    
+
+    @property
+    def positions(self) -> Dict[str, int]:
+        """Open positions as a ticker -> quantity dict (zero rows omitted)."""
+        return {t: int(self._positions[i])
+                for t, i in self._ticker_index.items()
+                if self._positions[i] != 0}
+
+    def _slot(self, ticker: str) -> int:
+        """Resolve (or grow) the position-array slot for a ticker."""
+        i = self._ticker_index.get(ticker)
+        if i is None:
+            i = len(self._ticker_index)
+            self._ticker_index[ticker] = i
+            self._positions = np.append(self._positions, 0)
+        return i
+
     def execute_trade(self,
                       ticker: str,
                       quantity: int,
                       price: float) -> bool:
         """
         Execute a simulated trade.
-        
+
         Args:
             ticker: Stock ticker
             quantity: Number of shares (positive=buy, negative=sell)
             price: Execution price
-            
+
         Returns:
             True if trade executed successfully
         """
         # TODO: Implement trade execution in later chunks
-        
+
         trade_value = abs(quantity * price)
         cost = trade_value * self.transaction_cost
-        
+
         # Check if we have enough capital
         if quantity > 0 and (trade_value + cost) > self.current_capital:
             return False
-        
-        # Update positions (placeholder)
-        if ticker not in self.positions:
-            self.positions[ticker] = 0
-        self.positions[ticker] += quantity
-        
+
+        # Update positions (resolve the slot first: it may grow the array)
+        i = self._slot(ticker)
+        self._positions[i] += quantity
+
         # Update capital
         self.current_capital -= (quantity * price + cost)
-        
+
         # Log trade
         self.trade_history.append({
             'timestamp': datetime.now(),
@@ -69,22 +91,28 @@ class PaperTrader:
             'price': price,
             'cost': cost
         })
-        
+
         return True
-    
-    def get_portfolio_value(self, current_prices: Dict[str, float]) -> float:
+
+    def get_portfolio_value(self,
+                            current_prices: Union[Dict[str, float], np.ndarray]) -> float:
         """
         Calculate current portfolio value.
-        
+
         Args:
-            current_prices: Dictionary of current prices
-            
+            current_prices: Prices aligned to the ticker universe
+                            (array, one BLAS dot product) or a
+                            ticker -> price dict (adapted per call)
+
         Returns:
             Total portfolio value
         """
-        position_value = sum(
-            self.positions.get(ticker, 0) * current_prices.get(ticker, 0)
-            for ticker in self.positions
-        )
-        
+        if isinstance(current_prices, np.ndarray):
+            position_value = float(self._positions @ current_prices)
+        else:
+            position_value = sum(
+                int(self._positions[i]) * current_prices.get(ticker, 0)
+                for ticker, i in self._ticker_index.items()
+            )
+
         return self.current_capital + position_value
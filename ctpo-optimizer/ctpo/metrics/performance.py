@@ -4,29 +4,307 @@ Portfolio performance metrics
 
 import numpy as np
 import pandas as pd
+from collections import OrderedDict
 from typing import Union, Optional, Dict, List
 from scipy import stats
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; fall back to vectorized NumPy
+    HAS_NUMBA = False
+    prange = range
+
+
+def _max_dd_kernel(returns: np.ndarray) -> float:
+    """
+    Single-pass maximum drawdown over a return series.
+
+    Fuses the cumprod, running max and drawdown min into one loop with
+    no temporaries — the vectorized version allocates three full-length
+    arrays and reads the data three times.
+
+    Args:
+        returns: Portfolio returns (1-D float array)
+
+    Returns:
+        Maximum drawdown (positive number)
+    """
+    cumulative = 1.0
+    running_max = 1.0
+    max_dd = 0.0
+    for i in range(returns.shape[0]):
+        cumulative *= 1.0 + returns[i]
+        if cumulative > running_max:
+            running_max = cumulative
+        drawdown = (cumulative - running_max) / running_max
+        if drawdown < max_dd:
+            max_dd = drawdown
+    return -max_dd
+
+
+def _excess_moments_kernel(returns: np.ndarray, rf_per_period: float):
+    """
+    Welford pass over excess returns for the Sharpe/Sortino inputs.
+
+    One sweep produces the mean, the standard deviation and the
+    downside standard deviation together; the NumPy route allocates the
+    excess array and then scans it three more times.
+
+    Args:
+        returns: Portfolio returns (1-D float array)
+        rf_per_period: Per-period risk-free rate
+
+    Returns:
+        (mean_excess, std, downside_std, downside_count)
+    """
+    n = returns.shape[0]
+    mean = 0.0
+    m2 = 0.0
+    dmean = 0.0
+    dm2 = 0.0
+    dn = 0
+    for i in range(n):
+        x = returns[i] - rf_per_period
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+        if x < 0.0:
+            dn += 1
+            ddelta = x - dmean
+            dmean += ddelta / dn
+            dm2 += ddelta * (x - dmean)
+    std = np.sqrt(m2 / n) if n > 0 else 0.0
+    downside_std = np.sqrt(dm2 / dn) if dn > 0 else 0.0
+    return mean, std, downside_std, dn
+
+
+def _central_moments_kernel(returns: np.ndarray):
+    """
+    Deviation power sums and downside moments in one fused sweep.
+
+    calculate_all needs the volatility, downside deviation, skewness
+    and kurtosis of the same series; computed separately that is six
+    full passes (pandas std, masked std, scipy skew/kurt). One loop
+    over the precomputed mean covers them all with no temporaries.
+
+    Args:
+        returns: Portfolio returns (1-D float array)
+
+    Returns:
+        (mean, m2_sum, m3_sum, m4_sum, downside_m2, downside_count)
+        where m*_sum are sums of deviation powers about the mean and
+        downside_m2 is the Welford M2 of the negative returns
+    """
+    n = returns.shape[0]
+    mean = 0.0
+    for i in range(n):
+        mean += returns[i]
+    mean /= n
+
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    dmean = 0.0
+    dm2 = 0.0
+    dn = 0
+    for i in range(n):
+        d = returns[i] - mean
+        d2 = d * d
+        m2 += d2
+        m3 += d2 * d
+        m4 += d2 * d2
+        if returns[i] < 0.0:
+            dn += 1
+            ddelta = returns[i] - dmean
+            dmean += ddelta / dn
+            dm2 += ddelta * (returns[i] - dmean)
+    return mean, m2, m3, m4, dm2, dn
+
+
+def _turnover_kernel(weights: np.ndarray) -> float:
+    """
+    Mean per-period turnover, fused into one streaming pass.
+
+    Replaces the diff/abs/sum chain, which materializes two full
+    (T-1) x N temporaries, with a scalar accumulation over adjacent
+    rows. Periods are independent, so the outer loop parallelizes
+    across cores on long rebalancing histories.
+
+    Args:
+        weights: Weight history ((T x N) float array)
+
+    Returns:
+        Average turnover per period
+    """
+    n_periods, n_assets = weights.shape
+    acc = 0.0
+    for t in prange(1, n_periods):
+        row = 0.0
+        for i in range(n_assets):
+            row += abs(weights[t, i] - weights[t - 1, i])
+        acc += row * 0.5
+    return acc / (n_periods - 1)
+
+
+if HAS_NUMBA:
+    # Explicit signatures force eager compilation at import (cached to
+    # disk after the first run), so the hot path never pays JIT warm-up
+    # — the closest this tree gets to AOT now that numba.pycc is gone.
+    # Each kernel also takes float32 input (half the bytes moved on
+    # these bandwidth-bound sweeps) while accumulating in float64.
+    _max_dd_kernel = njit(['f8(f8[::1])', 'f8(f4[::1])'],
+                          cache=True, fastmath=True)(_max_dd_kernel)
+    _excess_moments_kernel = njit(
+        ['Tuple((f8, f8, f8, i8))(f8[::1], f8)',
+         'Tuple((f8, f8, f8, i8))(f4[::1], f8)'],
+        cache=True)(_excess_moments_kernel)
+    _central_moments_kernel = njit(
+        ['Tuple((f8, f8, f8, f8, f8, i8))(f8[::1])',
+         'Tuple((f8, f8, f8, f8, f8, i8))(f4[::1])'],
+        cache=True)(_central_moments_kernel)
+    _turnover_kernel = njit(['f8(f8[:, ::1])', 'f8(f4[:, ::1])'],
+                            cache=True, fastmath=True,
+                            parallel=True)(_turnover_kernel)
+
+_SQRT_252 = np.sqrt(252.0)
+
+
+# Bounded LRU over complete stat sets. Callers routinely ask for the
+# four ratios on the same returns series after each rebalance cycle;
+# each public method used to re-sweep the full array. One entry per
+# (series content, rate parameters) serves all of them from one pass.
+_STATS_CACHE: "OrderedDict[tuple, Dict]" = OrderedDict()
+_STATS_CACHE_SIZE = 128
+
+
+def _compute_stats(returns: np.ndarray,
+                   risk_free_rate: float,
+                   periods_per_year: int) -> Dict:
+    """
+    Compute all scalar performance stats for a returns array at once.
+
+    Args:
+        returns: Contiguous float64 portfolio returns
+        risk_free_rate: Annual risk-free rate
+        periods_per_year: Trading periods per year
+
+    Returns:
+        Dict with 'sharpe', 'sortino', 'max_drawdown' and
+        'annualized_return'
+    """
+    key = (returns.shape[0], hash(returns.tobytes()),
+           risk_free_rate, periods_per_year)
+    hit = _STATS_CACHE.get(key)
+    if hit is not None:
+        _STATS_CACHE.move_to_end(key)
+        return hit
+
+    n = returns.shape[0]
+    # Every real caller annualizes daily data; fold that constant
+    sqrt_ppy = _SQRT_252 if periods_per_year == 252 else np.sqrt(periods_per_year)
+
+    # Sharpe and Sortino inputs in one sweep
+    if HAS_NUMBA and n > 0:
+        mean_excess, std, downside_std, downside_n = _excess_moments_kernel(
+            returns, risk_free_rate / periods_per_year)
+    else:
+        excess = returns - (risk_free_rate / periods_per_year)
+        mean_excess = np.mean(excess) if n > 0 else 0.0
+        std = np.std(excess) if n > 0 else 0.0  # shift-invariant
+        downside = excess[excess < 0]
+        downside_n = len(downside)
+        downside_std = np.std(downside) if downside_n > 0 else 0.0
+
+    if n == 0 or std == 0:
+        sharpe = 0.0
+    else:
+        sharpe = mean_excess / std * sqrt_ppy
+
+    if downside_n == 0:
+        sortino = np.inf
+    elif downside_std == 0:
+        sortino = 0.0
+    else:
+        sortino = mean_excess / downside_std * sqrt_ppy
+
+    # Max drawdown
+    if n == 0:
+        max_dd = 0.0
+    elif HAS_NUMBA:
+        max_dd = abs(_max_dd_kernel(returns))
+    else:
+        # In log space the cumulative product becomes a cumsum (better
+        # SIMD throughput than cumprod's serial multiply chain) and the
+        # ratio to the running max a subtraction; also immune to the
+        # over/underflow cumprod hits on long series
+        with np.errstate(divide='ignore'):  # a -100% return logs to -inf
+            log_cum = np.cumsum(np.log1p(returns))
+        log_max = np.maximum.accumulate(log_cum)
+        max_dd = abs(float(np.expm1(np.min(log_cum - log_max))))
+
+    # Annualized return: sum of log growth instead of a serial product
+    if n == 0:
+        annualized = 0.0
+    else:
+        with np.errstate(divide='ignore'):
+            total_return = np.expm1(np.sum(np.log1p(returns)))
+        annualized = (1 + total_return) ** (periods_per_year / n) - 1
+
+    result = {
+        'sharpe': sharpe,
+        'sortino': sortino,
+        'max_drawdown': max_dd,
+        'annualized_return': annualized,
+    }
+    _STATS_CACHE[key] = result
+    if len(_STATS_CACHE) > _STATS_CACHE_SIZE:
+        _STATS_CACHE.popitem(last=False)
+    return result
+
+
+def _as_array(returns: Union[np.ndarray, pd.Series],
+              dtype: type = np.float64) -> np.ndarray:
+    """
+    Normalize a returns input to a contiguous 1-D float array.
+
+    One call handles Series, lists and column vectors alike, and
+    guarantees the layout NumPy's vectorized reduction loops want.
+    float32 halves the bytes the streaming kernels move; they still
+    accumulate in float64.
+    """
+    arr = np.ascontiguousarray(returns, dtype=dtype).ravel()
+    if not arr.flags.writeable:
+        # pandas copy-on-write hands out read-only views, which the
+        # eagerly compiled kernel signatures reject
+        arr = arr.copy()
+    return arr
+
 
 class PerformanceMetrics:
     """
     Calculate comprehensive portfolio performance metrics.
     """
     
-    def __init__(self, risk_free_rate: float = 0.042):
+    def __init__(self, risk_free_rate: float = 0.042,
+                 dtype: type = np.float64):
         """
         Initialize performance metrics calculator.
         
         Args:
             risk_free_rate: Annual risk-free rate
+            dtype: Working precision for the streaming kernels;
+                   float32 halves memory traffic on long histories
         """
         self.rf = risk_free_rate / 252  # Daily risk-free rate
         self.rf_annual = risk_free_rate
+        self.dtype = dtype
     
     @staticmethod
     def sharpe_ratio(returns: Union[np.ndarray, pd.Series],
                      risk_free_rate: float = 0.02,
-                     periods_per_year: int = 252) -> float:
+                     periods_per_year: int = 252,
+                     dtype: type = np.float64) -> float:
         """
         Calculate Sharpe ratio.
         
@@ -38,20 +316,13 @@ class PerformanceMetrics:
         Returns:
             Sharpe ratio
         """
-        if isinstance(returns, pd.Series):
-            returns = returns.values
-        
-        excess_returns = returns - (risk_free_rate / periods_per_year)
-        
-        if len(returns) == 0 or np.std(returns) == 0:
-            return 0.0
-        
-        sharpe = np.mean(excess_returns) / np.std(excess_returns) * np.sqrt(periods_per_year)
-        
-        return sharpe
+        stats_ = _compute_stats(_as_array(returns, dtype), risk_free_rate,
+                                periods_per_year)
+        return stats_['sharpe']
     
     @staticmethod
-    def max_drawdown(returns: Union[np.ndarray, pd.Series]) -> float:
+    def max_drawdown(returns: Union[np.ndarray, pd.Series],
+                     dtype: type = np.float64) -> float:
         """
         Calculate maximum drawdown.
         
@@ -61,20 +332,13 @@ class PerformanceMetrics:
         Returns:
             Maximum drawdown (positive number)
         """
-        if isinstance(returns, pd.Series):
-            returns = returns.values
-        
-        # Calculate cumulative returns
-        cumulative = np.cumprod(1 + returns)
-        running_max = np.maximum.accumulate(cumulative)
-        drawdown = (cumulative - running_max) / running_max
-        
-        return abs(np.min(drawdown))
+        return _compute_stats(_as_array(returns, dtype), 0.02, 252)['max_drawdown']
     
     @staticmethod
     def sortino_ratio(returns: Union[np.ndarray, pd.Series],
                       risk_free_rate: float = 0.02,
-                      periods_per_year: int = 252) -> float:
+                      periods_per_year: int = 252,
+                      dtype: type = np.float64) -> float:
         """
         Calculate Sortino ratio (downside deviation).
         
@@ -86,26 +350,14 @@ class PerformanceMetrics:
         Returns:
             Sortino ratio
         """
-        if isinstance(returns, pd.Series):
-            returns = returns.values
-        
-        excess_returns = returns - (risk_free_rate / periods_per_year)
-        downside_returns = excess_returns[excess_returns < 0]
-        
-        if len(downside_returns) == 0:
-            return np.inf
-        
-        downside_std = np.std(downside_returns)
-        if downside_std == 0:
-            return 0.0
-        
-        sortino = np.mean(excess_returns) / downside_std * np.sqrt(periods_per_year)
-        
-        return sortino
+        stats_ = _compute_stats(_as_array(returns, dtype), risk_free_rate,
+                                periods_per_year)
+        return stats_['sortino']
     
     @staticmethod
     def calmar_ratio(returns: Union[np.ndarray, pd.Series],
-                     periods_per_year: int = 252) -> float:
+                     periods_per_year: int = 252,
+                     dtype: type = np.float64) -> float:
         """
         Calculate Calmar ratio (return / max drawdown).
         
@@ -116,17 +368,20 @@ class PerformanceMetrics:
         Returns:
             Calmar ratio
         """
-        annual_return = PerformanceMetrics.annualized_return(returns, periods_per_year)
-        max_dd = PerformanceMetrics.max_drawdown(returns)
-        
+        # One cache entry serves both the return and the drawdown
+        stats_ = _compute_stats(_as_array(returns, dtype), 0.02, periods_per_year)
+        annual_return = stats_['annualized_return']
+        max_dd = stats_['max_drawdown']
+
         if max_dd == 0:
             return np.inf
-        
+
         return annual_return / max_dd
     
     @staticmethod
     def annualized_return(returns: Union[np.ndarray, pd.Series],
-                         periods_per_year: int = 252) -> float:
+                         periods_per_year: int = 252,
+                         dtype: type = np.float64) -> float:
         """
         Calculate annualized return.
         
@@ -137,20 +392,12 @@ class PerformanceMetrics:
         Returns:
             Annualized return
         """
-        if isinstance(returns, pd.Series):
-            returns = returns.values
-        
-        if len(returns) == 0:
-            return 0.0
-        
-        total_return = np.prod(1 + returns) - 1
-        n_periods = len(returns)
-        annualized = (1 + total_return) ** (periods_per_year / n_periods) - 1
-        
-        return annualized
+        stats_ = _compute_stats(_as_array(returns, dtype), 0.02, periods_per_year)
+        return stats_['annualized_return']
     
     @staticmethod
-    def turnover(weights_history: np.ndarray) -> float:
+    def turnover(weights_history: np.ndarray,
+                 dtype: type = np.float64) -> float:
         """
         Calculate portfolio turnover.
         
@@ -162,11 +409,15 @@ class PerformanceMetrics:
         """
         if len(weights_history) < 2:
             return 0.0
-        
+
+        weights = np.ascontiguousarray(weights_history, dtype=dtype)
+        if HAS_NUMBA:
+            return _turnover_kernel(weights)
+
         # Calculate weight changes
-        weight_changes = np.abs(np.diff(weights_history, axis=0))
+        weight_changes = np.abs(np.diff(weights, axis=0))
         turnover = np.sum(weight_changes, axis=1) / 2  # Divide by 2 (buy + sell)
-        
+
         return np.mean(turnover)
     
     def calculate_all(self, 
@@ -188,23 +439,64 @@ class PerformanceMetrics:
             returns = pd.Series(returns)
         
         metrics = {}
-        
+
+        # One fused pass (cached) serves the annualized return, max
+        # drawdown and both risk-adjusted ratios below; the public
+        # methods would redo the O(T) content hash per call
+        arr = _as_array(returns, self.dtype)
+        n = arr.size
+        stats_all = _compute_stats(arr, self.rf_annual, 252)
+
         # === Return Metrics ===
-        metrics['total_return'] = float(np.prod(1 + returns) - 1)
-        metrics['annualized_return'] = self.annualized_return(returns)
-        
+        # Log-sum instead of a serial product: tree-parallel reduction,
+        # no overflow on long histories (annualized_return already
+        # compounds the same way inside _compute_stats)
+        with np.errstate(divide='ignore'):  # a -100% return logs to -inf
+            metrics['total_return'] = float(np.expm1(np.sum(np.log1p(arr))))
+        metrics['annualized_return'] = stats_all['annualized_return']
+
         # === Risk Metrics ===
-        metrics['volatility'] = float(returns.std() * np.sqrt(252))
-        downside = returns[returns < 0]
-        metrics['downside_deviation'] = float(downside.std() * np.sqrt(252) if len(downside) > 0 else 0)
-        metrics['max_drawdown'] = self.max_drawdown(returns)
-        metrics['var_95'] = float(np.percentile(returns, 5))
-        metrics['cvar_95'] = float(returns[returns <= metrics['var_95']].mean())
+        if HAS_NUMBA and n > 1:
+            # Volatility, downside deviation, skewness and kurtosis all
+            # come out of one fused sweep instead of six array passes
+            mean, m2_sum, m3_sum, m4_sum, downside_m2, downside_n = \
+                _central_moments_kernel(arr)
+            metrics['volatility'] = float(
+                np.sqrt(m2_sum / (n - 1)) * _SQRT_252)
+            if downside_n > 1:
+                metrics['downside_deviation'] = float(
+                    np.sqrt(downside_m2 / (downside_n - 1)) * _SQRT_252)
+            else:  # pandas std needs two observations (ddof=1)
+                metrics['downside_deviation'] = float(np.nan) if downside_n else 0.0
+            m2 = m2_sum / n
+            # Same near-constant guard scipy applies before dividing
+            # by a variance lost to catastrophic cancellation
+            degenerate = m2 <= (np.finfo(np.float64).resolution * mean) ** 2
+            metrics['skewness'] = float(
+                np.nan if degenerate else (m3_sum / n) / m2 ** 1.5)
+            metrics['kurtosis'] = float(
+                np.nan if degenerate else (m4_sum / n) / m2 ** 2 - 3.0)
+        else:
+            metrics['volatility'] = float(returns.std() * np.sqrt(252))
+            downside = returns[returns < 0]
+            metrics['downside_deviation'] = float(downside.std() * np.sqrt(252) if len(downside) > 0 else 0)
+            metrics['skewness'] = float(stats.skew(returns))
+            metrics['kurtosis'] = float(stats.kurtosis(returns))
+        metrics['max_drawdown'] = stats_all['max_drawdown']
+        # Tail stats via quickselect: partition is O(T) where a full
+        # percentile sort is O(T log T), and the lower tail comes back
+        # in place so CVaR needs no boolean mask or copy
+        tail_k = max(1, int(0.05 * arr.size))
+        lower = np.partition(arr, tail_k)
+        metrics['var_95'] = float(lower[tail_k])
+        metrics['cvar_95'] = float(lower[:tail_k].mean())
         
         # === Risk-Adjusted Returns ===
-        metrics['sharpe_ratio'] = self.sharpe_ratio(returns, self.rf_annual)
-        metrics['sortino_ratio'] = self.sortino_ratio(returns, self.rf_annual)
-        metrics['calmar_ratio'] = self.calmar_ratio(returns)
+        metrics['sharpe_ratio'] = stats_all['sharpe']
+        metrics['sortino_ratio'] = stats_all['sortino']
+        metrics['calmar_ratio'] = (
+            stats_all['annualized_return'] / stats_all['max_drawdown']
+            if stats_all['max_drawdown'] != 0 else np.inf)
         
         # Omega ratio
         returns_above = returns[returns > 0]
@@ -212,23 +504,31 @@ class PerformanceMetrics:
         metrics['omega_ratio'] = float(returns_above.sum() / returns_below.sum() if returns_below.sum() > 0 else np.inf)
         
         # === Distribution Metrics ===
-        metrics['skewness'] = float(stats.skew(returns))
-        metrics['kurtosis'] = float(stats.kurtosis(returns))
-        p95 = np.percentile(returns, 95)
-        p5 = np.percentile(returns, 5)
+        # (skewness/kurtosis computed with the risk metrics above)
+        p95 = float(np.partition(arr, arr.size - tail_k)[arr.size - tail_k])
+        p5 = metrics['var_95']
         metrics['tail_ratio'] = float(abs(p95 / p5) if p5 != 0 else np.inf)
         
         # === Portfolio Characteristics ===
         if weights_history:
-            enps = [1.0 / np.sum(w['weights']**2) for w in weights_history if 'weights' in w]
-            metrics['avg_effective_assets'] = float(np.mean(enps)) if enps else 0
-            
-            herfindahls = [np.sum(w['weights']**2) for w in weights_history if 'weights' in w]
-            metrics['avg_concentration'] = float(np.mean(herfindahls)) if herfindahls else 0
+            snapshots = [w['weights'] for w in weights_history if 'weights' in w]
+            if snapshots:
+                # One stacked einsum replaces 2T tiny np.sum calls;
+                # the square+row-sum fuse into a single contiguous pass
+                W = np.stack(snapshots)
+                herfindahls = np.einsum('ij,ij->i', W, W)
+                metrics['avg_effective_assets'] = float((1.0 / herfindahls).mean())
+                metrics['avg_concentration'] = float(herfindahls.mean())
+            else:
+                metrics['avg_effective_assets'] = 0
+                metrics['avg_concentration'] = 0
         
         # === Stress Period Performance ===
         if len(returns) > 20 and isinstance(returns.index, pd.DatetimeIndex):
-            monthly_returns = returns.resample('ME').apply(lambda x: np.prod(1 + x) - 1)
+            # Log-space turns the per-group Python lambda into a
+            # cythonized sum: compound return = expm1(sum(log1p(r)))
+            with np.errstate(divide='ignore'):  # -100% months log to -inf
+                monthly_returns = np.expm1(np.log1p(returns).resample('ME').sum())
             metrics['worst_month'] = float(monthly_returns.min())
             metrics['best_month'] = float(monthly_returns.max())
         else:
@@ -3,7 +3,8 @@ CAPM and expected returns estimation with stress correction
 """
 
 import numpy as np
-from typing import Optional, Tuple
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
 import pandas as pd
 
 
@@ -43,7 +44,80 @@ class CAPMModel:
         self.beta_ceiling = beta_ceiling
         self.betas = None
         self.market_return = None
-    
+        # Stress sweeps re-fit the same return window for several
+        # sigma_market values; a few memoized regressions cover them
+        self._fit_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._fit_cache_size = 16
+
+    def reset(self) -> None:
+        """Drop memoized regression results and fitted betas."""
+        self._fit_cache.clear()
+        self.betas = None
+
+    @staticmethod
+    def _fingerprint(returns: np.ndarray,
+                     market_returns: np.ndarray) -> tuple:
+        """Cheap cache key for a (returns, market) pair."""
+        return (returns.shape,
+                float(returns[0, 0]), float(returns[-1, -1]),
+                float(returns.sum()),
+                float(market_returns[0]), float(market_returns[-1]),
+                float(market_returns.sum()))
+
+    def _fit_market(self,
+                    returns: np.ndarray,
+                    market_returns: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        Regress all assets against the market series in one pass.
+
+        Betas and market correlations share the same demeaned arrays
+        and the same cross-product gemv, so both come out of a single
+        sweep instead of separate per-asset covariance calls.
+
+        Args:
+            returns: Asset returns (T x N)
+            market_returns: Market returns (T,)
+
+        Returns:
+            (raw_betas, correlations, market_var); betas of one and
+            zero correlations in the degenerate no-variation case
+        """
+        returns = np.ascontiguousarray(returns, dtype=np.float64)
+        market_returns = np.ascontiguousarray(market_returns, dtype=np.float64)
+        n_assets = returns.shape[1]
+        T = returns.shape[0]
+
+        key = self._fingerprint(returns, market_returns)
+        hit = self._fit_cache.get(key)
+        if hit is not None:
+            self._fit_cache.move_to_end(key)
+            return hit
+
+        market_demeaned = market_returns - market_returns.mean()
+        market_var = np.var(market_demeaned)
+
+        if market_var < 1e-10:
+            # Degenerate case: no market variation
+            result = (np.ones(n_assets), np.zeros(n_assets), market_var)
+        else:
+            returns_demeaned = returns - returns.mean(axis=0)
+            cross = returns_demeaned.T @ market_demeaned  # T * cov(asset, market)
+
+            betas = cross / (T * market_var)
+            # Divide straight into preallocated output; the fresh
+            # std_assets array doubles as the denominator buffer, so
+            # no list round-trip and no extra N-sized temporaries
+            denom = returns_demeaned.std(axis=0)
+            denom *= T * np.sqrt(market_var)
+            correlations = np.empty(n_assets)
+            np.divide(cross, denom, out=correlations)
+            result = (betas, correlations, market_var)
+
+        self._fit_cache[key] = result
+        if len(self._fit_cache) > self._fit_cache_size:
+            self._fit_cache.popitem(last=False)
+        return result
+
     def calculate_betas(self,
                        returns: np.ndarray,
                        market_returns: Optional[np.ndarray] = None) -> np.ndarray:
@@ -60,70 +134,65 @@ class CAPMModel:
         if market_returns is None:
             # Use equal-weight portfolio as market proxy
             market_returns = returns.mean(axis=1)
-        
-        n_assets = returns.shape[1]
-        betas = np.zeros(n_assets)
-        
-        # Demean for regression
-        market_demeaned = market_returns - market_returns.mean()
-        market_var = np.var(market_demeaned)
-        
+
+        betas, _, market_var = self._fit_market(returns, market_returns)
+
         if market_var < 1e-10:
-            # Degenerate case: no market variation
-            self.betas = np.ones(n_assets)
+            self.betas = betas  # degenerate case: all ones
             return self.betas
-        
-        for i in range(n_assets):
-            asset_demeaned = returns[:, i] - returns[:, i].mean()
-            covariance = np.mean(asset_demeaned * market_demeaned)
-            betas[i] = covariance / market_var
-        
+
         # Clip betas to reasonable range
         betas = np.clip(betas, self.beta_floor, self.beta_ceiling)
         self.betas = betas
-        
+
         return betas
     
     def compute_expected_returns(self,
                                 beta: np.ndarray,
-                                sigma_market: float,
+                                sigma_market: Union[float, np.ndarray],
                                 rho_stress: Optional[np.ndarray] = None,
                                 r_market: Optional[float] = None) -> np.ndarray:
         """
         Compute expected returns with stress correction.
-        
+
         Formula:
         E(R_i) = R_f + β_i(R_m - R_f) - λ_stress × max(0, σ_M - threshold) × max(0, ρ_i - threshold)
-        
+
         Args:
             beta: Asset betas (N,)
-            sigma_market: Market volatility
+            sigma_market: Market volatility, a scalar or an (S,) array
+                          of scenario volatilities evaluated in one
+                          broadcast instead of S separate calls
             rho_stress: Asset correlations with market (N,), uses beta/|beta| if None
             r_market: Market return, uses risk_free + premium if None
-            
+
         Returns:
-            Expected returns (N,)
+            Expected returns (N,), or (S, N) for an array of sigmas
         """
         if r_market is None:
             r_market = self.risk_free_rate + self.market_premium
-        
+
         # Base CAPM return
         base_return = self.risk_free_rate + beta * (r_market - self.risk_free_rate)
-        
-        # Stress penalty activates only when volatility > threshold
-        vol_excess = np.maximum(0, sigma_market - self.vol_threshold)
-        
+
+        # Stress penalty activates only when volatility > threshold;
+        # an (S, 1) column of sigmas broadcasts against the (N,) assets
+        sigma_market = np.asarray(sigma_market, dtype=np.float64)
+        scalar_sigma = sigma_market.ndim == 0
+        vol_excess = np.maximum(
+            0, np.atleast_1d(sigma_market)[:, None] - self.vol_threshold)
+
         # Use beta-derived correlation if not provided
         if rho_stress is None:
             # Approximate correlation from beta (assuming β = ρ * σ_i / σ_m)
             rho_stress = np.sign(beta) * np.minimum(1.0, np.abs(beta))
-        
+
         corr_excess = np.maximum(0, rho_stress - self.rho_threshold)
         stress_penalty = self.lambda_stress * vol_excess * corr_excess
-        
+
         expected_returns = base_return - stress_penalty
-        
-        return expected_returns
+
+        return expected_returns[0] if scalar_sigma else expected_returns
     
     def estimate_expected_returns(self,
                                   returns: np.ndarray,
@@ -140,20 +209,19 @@ class CAPMModel:
         Returns:
             (expected_returns, betas)
         """
-        # Calculate betas
         if market_returns is None:
             market_returns = returns.mean(axis=1)
-        
-        betas = self.calculate_betas(returns, market_returns)
-        
+
+        # Betas and market correlations from the same demeaned pass
+        betas, correlations, market_var = self._fit_market(returns, market_returns)
+        if market_var >= 1e-10:
+            betas = np.clip(betas, self.beta_floor, self.beta_ceiling)
+        self.betas = betas
+
         # Estimate market volatility if not provided
         if sigma_market is None:
             sigma_market = np.std(market_returns) * np.sqrt(252)  # Annualized
         
-        # Compute correlations with market
-        correlations = np.array([np.corrcoef(returns[:, i], market_returns)[0, 1] 
-                                for i in range(returns.shape[1])])
-        
         # Calculate expected returns with stress adjustment
         expected_returns = self.compute_expected_returns(
             betas, sigma_market, correlations
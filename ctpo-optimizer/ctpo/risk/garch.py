@@ -4,10 +4,26 @@ GARCH volatility modeling
 
 import numpy as np
 import pandas as pd
+from collections import OrderedDict
 from typing import Tuple, Optional, Union
 from arch import arch_model
+from scipy.optimize import minimize
 import warnings
 
+from .recursions_numba import (
+    HAS_NUMBA,
+    garch11_nll,
+    garch11_conditional_variance,
+    garch11_variance_into,
+    batch_garch11_volatilities,
+)
+
+try:
+    from joblib import Parallel, delayed
+    HAS_JOBLIB = True
+except ImportError:  # joblib is optional; fall back to the serial loop
+    HAS_JOBLIB = False
+
 
 class GARCHModel:
     """
@@ -19,7 +35,8 @@ class GARCHModel:
                  q: int = 1, 
                  distribution: str = 'normal',
                  min_volatility: float = 0.01,
-                 max_volatility: float = 1.0):
+                 max_volatility: float = 1.0,
+                 keep_full: bool = True):
         """
         Initialize GARCH model.
         
@@ -29,55 +46,123 @@ class GARCHModel:
             distribution: Error distribution ('normal', 't', 'skewt')
             min_volatility: Minimum volatility floor
             max_volatility: Maximum volatility cap
+            keep_full: Retain the full conditional volatility path
+                       (float32). Callers that only read the last
+                       value can pass False to keep O(1) memory per
+                       fitted asset instead of O(T)
         """
         self.p = p
         self.q = q
         self.distribution = distribution
         self.min_volatility = min_volatility
         self.max_volatility = max_volatility
+        self.keep_full = keep_full
         self.fitted_model = None
         self.conditional_volatility = None
-    
-    def fit(self, returns: Union[np.ndarray, pd.Series], scale: float = 100.0) -> 'GARCHModel':
+        self._last_vol = None
+        self._fast_params = None
+        self._fast_state = None  # (last_eps, last_var) in scaled units
+
+    def _store_volatility(self, volatility: np.ndarray) -> None:
+        """Record the fitted volatility path per the keep_full policy."""
+        self._last_vol = float(volatility[-1])
+        if self.keep_full:
+            # float32 halves the footprint; callers only read values
+            self.conditional_volatility = volatility.astype(
+                np.float32, copy=False)
+        else:
+            self.conditional_volatility = None
+
+    def _fit_fast(self,
+                  returns_scaled: np.ndarray,
+                  scale: float,
+                  out: Optional[np.ndarray] = None) -> None:
+        """
+        Fit a GARCH(1,1) via the JIT likelihood and L-BFGS-B.
+
+        Bypasses arch's Python layer (formula handling, results object,
+        parameter covariance) when only the conditional variances and
+        the next-step forecast are needed.
+
+        Args:
+            returns_scaled: Scaled return series (contiguous float64)
+            scale: Scale factor applied to the returns
+            out: Optional scratch buffer for the variance recursion
+        """
+        result = minimize(
+            garch11_nll,
+            x0=np.array([0.05, 0.05, 0.90]),
+            args=(returns_scaled,),
+            method='L-BFGS-B',
+            bounds=[(1e-8, None), (0.0, 1.0), (0.0, 1.0)],
+        )
+        if not np.isfinite(result.fun) or result.fun >= 1e10:
+            raise RuntimeError("GARCH likelihood optimization failed")
+
+        if out is not None and out.size == returns_scaled.size:
+            variances = out
+            garch11_variance_into(result.x, returns_scaled, variances)
+        else:
+            variances = garch11_conditional_variance(result.x, returns_scaled)
+        self._fast_params = result.x
+        self._fast_state = (float(returns_scaled[-1]), float(variances[-1]))
+        # sqrt and unscale in place: variances is ours (or the caller's
+        # scratch), so no fresh T-length temporaries
+        volatility = np.sqrt(variances, out=variances)
+        volatility /= scale
+        self._store_volatility(volatility)
+
+    def fit(self,
+            returns: Union[np.ndarray, pd.Series],
+            scale: float = 100.0,
+            out: Optional[np.ndarray] = None) -> 'GARCHModel':
         """
         Fit GARCH model to returns.
-        
+
         Args:
             returns: Return series
             scale: Scale factor for numerical stability (returns * scale)
-            
+            out: Optional length-T scratch buffer the fast path writes
+                 its variance recursion into, so batch callers reuse
+                 one allocation across assets (ignored by the arch
+                 path)
+
         Returns:
             Self for chaining
         """
-        # Convert to pandas Series if numpy array
-        if isinstance(returns, np.ndarray):
-            returns = pd.Series(returns)
-        
-        # Scale returns for numerical stability
-        returns_scaled = returns * scale
-        
+        values = returns.values if isinstance(returns, pd.Series) else np.asarray(returns)
+
         try:
+            if HAS_NUMBA and self.distribution == 'normal' \
+                    and self.p == 1 and self.q == 1:
+                # Fast path: JIT recursion + L-BFGS-B, no arch overhead
+                self._fit_fast(
+                    np.ascontiguousarray(values * scale, dtype=np.float64),
+                    scale, out)
+                return self
+
             # Fit GARCH(p,q) model
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
                 model = arch_model(
-                    returns_scaled, 
-                    vol='Garch', 
-                    p=self.p, 
+                    pd.Series(values * scale),
+                    vol='Garch',
+                    p=self.p,
                     q=self.q,
                     dist=self.distribution,
                     rescale=False
                 )
                 self.fitted_model = model.fit(disp='off', show_warning=False)
-                
+
                 # Extract conditional volatility (unscale)
-                self.conditional_volatility = self.fitted_model.conditional_volatility.values / scale
-                
+                self._store_volatility(
+                    self.fitted_model.conditional_volatility.values / scale)
+
         except Exception as e:
             # Fallback to historical volatility if GARCH fails
             warnings.warn(f"GARCH fitting failed: {e}. Using historical volatility.")
-            self.conditional_volatility = np.ones(len(returns)) * np.std(returns)
-        
+            self._store_volatility(np.ones(len(values)) * np.std(values))
+
         return self
     
     def forecast_volatility(self, horizon: int = 1) -> float:
@@ -90,12 +175,22 @@ class GARCHModel:
         Returns:
             Forecasted volatility (annualized if horizon=252)
         """
+        if self.fitted_model is None and self._fast_params is not None:
+            # One-step variance from the fitted recursion, in the same
+            # scaled units arch's forecast reports
+            omega, alpha, beta = self._fast_params
+            last_eps, last_var = self._fast_state
+            variance_forecast = omega + alpha * last_eps ** 2 + beta * last_var
+            volatility = np.clip(np.sqrt(variance_forecast),
+                                 self.min_volatility, self.max_volatility)
+            return float(volatility)
+
         if self.fitted_model is None:
             # Return last conditional volatility or default
-            if self.conditional_volatility is not None:
-                return float(self.conditional_volatility[-1])
+            if self._last_vol is not None:
+                return self._last_vol
             return self.min_volatility
-        
+
         try:
             # Forecast from fitted model
             forecast = self.fitted_model.forecast(horizon=horizon)
@@ -109,7 +204,7 @@ class GARCHModel:
             
         except Exception as e:
             warnings.warn(f"GARCH forecast failed: {e}")
-            return float(self.conditional_volatility[-1]) if self.conditional_volatility is not None else self.min_volatility
+            return self._last_vol if self._last_vol is not None else self.min_volatility
     
     def get_last_volatility(self) -> float:
         """
@@ -118,49 +213,137 @@ class GARCHModel:
         Returns:
             Last volatility estimate
         """
-        if self.conditional_volatility is not None and len(self.conditional_volatility) > 0:
-            return float(self.conditional_volatility[-1])
+        if self._last_vol is not None:
+            return self._last_vol
         return self.min_volatility
 
 
-def estimate_garch_volatilities(returns_df: pd.DataFrame,
+def _fit_one_garch(asset_returns: np.ndarray,
+                   p: int,
+                   q: int,
+                   min_vol: float,
+                   max_vol: float,
+                   out: Optional[np.ndarray] = None) -> float:
+    """
+    Fit one asset's GARCH volatility (module-level so it pickles).
+
+    Args:
+        asset_returns: NaN-free return series for a single asset
+        p: GARCH lag order
+        q: ARCH lag order
+        min_vol: Minimum volatility
+        max_vol: Maximum volatility
+        out: Optional scratch buffer reused across serial fits
+
+    Returns:
+        Last conditional volatility, or historical std on failure or
+        insufficient data
+    """
+    if len(asset_returns) < 50:
+        return float(np.std(asset_returns))
+
+    try:
+        # Only the last volatility is consumed; skip the O(T) path
+        model = GARCHModel(p=p, q=q, min_volatility=min_vol,
+                           max_volatility=max_vol, keep_full=False)
+        model.fit(asset_returns, out=out)
+        return model.get_last_volatility()
+    except Exception:
+        # Fallback to historical std
+        return float(np.std(asset_returns))
+
+
+# Fit results keyed by column fingerprint. Live loops refit every
+# rebalance tick but most asset histories are unchanged between
+# ticks, so nearly all lookups hit
+_VOL_CACHE: "OrderedDict[tuple, float]" = OrderedDict()
+_VOL_CACHE_SIZE = 1024
+
+
+def _column_key(col: np.ndarray, p: int, q: int) -> tuple:
+    """Cheap cache key for one asset's return series."""
+    return (col.shape[0], p, q,
+            float(col[0]), float(col[-1]), float(col.sum()))
+
+
+def clear_volatility_cache() -> None:
+    """Drop memoized per-column GARCH fits."""
+    _VOL_CACHE.clear()
+
+
+def estimate_garch_volatilities(returns_df: Union[pd.DataFrame, np.ndarray],
                                 p: int = 1,
                                 q: int = 1,
                                 min_vol: float = 0.01,
                                 max_vol: float = 1.0) -> np.ndarray:
     """
-    Estimate GARCH volatilities for all assets in a DataFrame.
-    
+    Estimate GARCH volatilities for all assets in a returns matrix.
+
     Args:
-        returns_df: Returns DataFrame (T x N)
+        returns_df: Returns DataFrame or array (T x N)
         p: GARCH lag order
         q: ARCH lag order
         min_vol: Minimum volatility
         max_vol: Maximum volatility
-        
+
     Returns:
         Array of volatilities (N,)
     """
-    n_assets = returns_df.shape[1]
-    volatilities = np.zeros(n_assets)
-    
-    for i in range(n_assets):
-        asset_returns = returns_df.iloc[:, i]
-        
-        # Skip if insufficient data
-        if len(asset_returns.dropna()) < 50:
-            volatilities[i] = np.std(asset_returns.dropna())
-            continue
-        
-        try:
-            model = GARCHModel(p=p, q=q, min_volatility=min_vol, max_volatility=max_vol)
-            model.fit(asset_returns.dropna())
-            volatilities[i] = model.get_last_volatility()
-        except Exception:
-            # Fallback to historical std
-            volatilities[i] = np.std(asset_returns.dropna())
-    
+    # Column slices of the raw array skip per-asset Series construction
+    # and pandas dropna; the fits themselves dominate either way
+    values = returns_df.values if isinstance(returns_df, pd.DataFrame) \
+        else np.asarray(returns_df)
+    n_assets = values.shape[1]
+
+    # Pre-extract the NaN-free columns so each task ships a small
+    # array instead of the full matrix
+    columns = [values[:, i][~np.isnan(values[:, i])] for i in range(n_assets)]
+
+    # Serve unchanged columns from the cache; only the misses fit
+    keys = [_column_key(col, p, q) if col.size else None for col in columns]
+    volatilities = np.empty(n_assets)
+    misses = []
+    for i, key in enumerate(keys):
+        hit = _VOL_CACHE.get(key) if key is not None else None
+        if hit is not None:
+            _VOL_CACHE.move_to_end(key)
+            volatilities[i] = hit
+        else:
+            misses.append(i)
+
+    if misses:
+        n_rows = values.shape[0]
+        if (HAS_NUMBA and p == 1 and q == 1 and len(misses) >= 4
+                and n_rows >= 50
+                and all(columns[i].size == n_rows for i in misses)):
+            # Missing columns in one compiled call: the prange kernel
+            # fits every asset in-process, so there is no pool spawn
+            # and no per-asset optimizer setup
+            fitted = batch_garch11_volatilities(np.ascontiguousarray(
+                values[:, misses] * 100.0, dtype=np.float64)) / 100.0
+        elif HAS_JOBLIB and len(misses) > 1:
+            # Each MLE fit is independent and compute-bound, so the
+            # assets spread across cores with near-linear scaling
+            fitted = Parallel(n_jobs=-1, prefer='processes',
+                              batch_size='auto')(
+                delayed(_fit_one_garch)(columns[i], p, q, min_vol, max_vol)
+                for i in misses)
+        else:
+            # One scratch buffer serves every serial fit; column views
+            # of it stay contiguous so the JIT recursion accepts them
+            buf = np.empty(n_rows)
+            fitted = [_fit_one_garch(columns[i], p, q, min_vol, max_vol,
+                                     out=buf[:columns[i].size])
+                      for i in misses]
+
+        for i, vol in zip(misses, fitted):
+            volatilities[i] = vol
+            if keys[i] is not None:
+                _VOL_CACHE[keys[i]] = float(vol)
+        while len(_VOL_CACHE) > _VOL_CACHE_SIZE:
+            _VOL_CACHE.popitem(last=False)
+
     # Clip to range
     volatilities = np.clip(volatilities, min_vol, max_vol)
-    
+
     return volatilities
@@ -0,0 +1,217 @@
+"""
+JIT-compiled GARCH(1,1) recursions
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; arch remains the fallback
+    HAS_NUMBA = False
+    prange = range
+
+_LOG_2PI = np.log(2.0 * np.pi)
+
+
+def garch11_nll(params: np.ndarray, returns: np.ndarray) -> float:
+    """
+    Negative log-likelihood of a GARCH(1,1) under normal errors.
+
+    The variance recursion and likelihood accumulate in one loop with
+    scalar state, so each optimizer iteration is a single pass over
+    the returns with no Python-level overhead.
+
+    Args:
+        params: (omega, alpha, beta)
+        returns: Scaled return series (1-D float array)
+
+    Returns:
+        Negative log-likelihood (large constant outside the
+        stationarity region, so the optimizer stays inside it)
+    """
+    omega = params[0]
+    alpha = params[1]
+    beta = params[2]
+    if omega <= 0.0 or alpha < 0.0 or beta < 0.0 or alpha + beta >= 0.999:
+        return 1e10
+
+    var = omega / (1.0 - alpha - beta)
+    ll = 0.0
+    for t in range(returns.shape[0]):
+        eps = returns[t]
+        ll += 0.5 * (_LOG_2PI + np.log(var) + eps * eps / var)
+        var = omega + alpha * eps * eps + beta * var
+    return ll
+
+
+def garch11_conditional_variance(params: np.ndarray,
+                                 returns: np.ndarray) -> np.ndarray:
+    """
+    Materialize the conditional variance path for fitted parameters.
+
+    Args:
+        params: (omega, alpha, beta)
+        returns: Scaled return series (1-D float array)
+
+    Returns:
+        Conditional variances, one per observation
+    """
+    omega = params[0]
+    alpha = params[1]
+    beta = params[2]
+    n = returns.shape[0]
+    out = np.empty(n)
+    var = omega / (1.0 - alpha - beta)
+    for t in range(n):
+        out[t] = var
+        eps = returns[t]
+        var = omega + alpha * eps * eps + beta * var
+    return out
+
+
+def garch11_variance_into(params: np.ndarray,
+                          returns: np.ndarray,
+                          out: np.ndarray) -> None:
+    """
+    garch11_conditional_variance writing into a caller-owned buffer.
+
+    Batch callers fit many assets of equal length; reusing one scratch
+    buffer keeps the loop allocation-free and in cache.
+
+    Args:
+        params: (omega, alpha, beta)
+        returns: Scaled return series (1-D float array)
+        out: Output buffer, same length as returns
+    """
+    omega = params[0]
+    alpha = params[1]
+    beta = params[2]
+    var = omega / (1.0 - alpha - beta)
+    for t in range(returns.shape[0]):
+        out[t] = var
+        eps = returns[t]
+        var = omega + alpha * eps * eps + beta * var
+
+
+if HAS_NUMBA:
+    garch11_nll = njit('f8(f8[::1], f8[::1])',
+                       cache=True, fastmath=True)(garch11_nll)
+    garch11_conditional_variance = njit(
+        'f8[::1](f8[::1], f8[::1])',
+        cache=True, fastmath=True)(garch11_conditional_variance)
+    garch11_variance_into = njit(
+        'void(f8[::1], f8[::1], f8[::1])',
+        cache=True, fastmath=True)(garch11_variance_into)
+
+
+def _garch11_fit_nm(returns: np.ndarray):
+    """
+    Fit GARCH(1,1) by Nelder-Mead on the penalized likelihood.
+
+    A compact derivative-free minimizer that runs entirely in
+    nopython mode, so whole-portfolio fits can parallelize across
+    assets inside one compiled region (scipy's optimizers cannot be
+    called from there). The stationarity penalty in garch11_nll acts
+    as the bound constraint.
+
+    Args:
+        returns: Scaled return series (contiguous float64)
+
+    Returns:
+        (params, nll) for the best vertex found
+    """
+    simplex = np.empty((4, 3))
+    for k in range(4):
+        simplex[k, 0] = 0.05
+        simplex[k, 1] = 0.05
+        simplex[k, 2] = 0.90
+    simplex[1, 0] += 0.02
+    simplex[2, 1] += 0.02
+    simplex[3, 2] += 0.03
+
+    f = np.empty(4)
+    for k in range(4):
+        f[k] = garch11_nll(simplex[k], returns)
+
+    for _ in range(300):
+        order = np.argsort(f)
+        simplex = simplex[order]
+        f = f[order]
+        if f[3] - f[0] < 1e-9 * (abs(f[0]) + 1e-12):
+            break
+
+        centroid = (simplex[0] + simplex[1] + simplex[2]) / 3.0
+        reflected = centroid + (centroid - simplex[3])
+        f_r = garch11_nll(reflected, returns)
+        if f_r < f[0]:
+            expanded = centroid + 2.0 * (centroid - simplex[3])
+            f_e = garch11_nll(expanded, returns)
+            if f_e < f_r:
+                simplex[3] = expanded
+                f[3] = f_e
+            else:
+                simplex[3] = reflected
+                f[3] = f_r
+        elif f_r < f[2]:
+            simplex[3] = reflected
+            f[3] = f_r
+        else:
+            contracted = centroid + 0.5 * (simplex[3] - centroid)
+            f_c = garch11_nll(contracted, returns)
+            if f_c < f[3]:
+                simplex[3] = contracted
+                f[3] = f_c
+            else:
+                for k in range(1, 4):
+                    simplex[k] = simplex[0] + 0.5 * (simplex[k] - simplex[0])
+                    f[k] = garch11_nll(simplex[k], returns)
+
+    best = int(np.argmin(f))
+    return np.ascontiguousarray(simplex[best]), f[best]
+
+
+def batch_garch11_volatilities(returns_scaled: np.ndarray) -> np.ndarray:
+    """
+    Last conditional volatility for every asset in one compiled call.
+
+    The outer asset loop runs under prange, so a whole portfolio fits
+    in parallel inside the process with no pool spawn or per-asset
+    optimizer setup. Assets whose fit lands outside the stationarity
+    region fall back to their sample standard deviation, mirroring
+    the per-asset fallback.
+
+    Args:
+        returns_scaled: Scaled returns, (T x N) contiguous float64
+
+    Returns:
+        Last conditional volatilities (N,), scaled units
+    """
+    n_assets = returns_scaled.shape[1]
+    n_obs = returns_scaled.shape[0]
+    out = np.empty(n_assets)
+    for i in prange(n_assets):
+        r = np.ascontiguousarray(returns_scaled[:, i])
+        params, nll = _garch11_fit_nm(r)
+        if nll >= 1e10:
+            out[i] = r.std()
+        else:
+            omega = params[0]
+            alpha = params[1]
+            beta = params[2]
+            var = omega / (1.0 - alpha - beta)
+            var_last = var
+            for t in range(n_obs):
+                var_last = var
+                eps = r[t]
+                var = omega + alpha * eps * eps + beta * var
+            out[i] = np.sqrt(var_last)
+    return out
+
+
+if HAS_NUMBA:
+    _garch11_fit_nm = njit('Tuple((f8[::1], f8))(f8[::1])',
+                           cache=True)(_garch11_fit_nm)
+    batch_garch11_volatilities = njit('f8[::1](f8[:, ::1])',
+                                      cache=True,
+                                      parallel=True)(batch_garch11_volatilities)
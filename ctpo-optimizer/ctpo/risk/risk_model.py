@@ -4,44 +4,127 @@ Integrated risk model combining GARCH, correlation stress, and CAPM
 
 import numpy as np
 import pandas as pd
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Union
 from .garch import estimate_garch_volatilities
-from .correlation import StressCorrelation
+from .correlation import StressCorrelation, mean_abs_offdiag, HAS_NUMBA
 from .capm import CAPMModel
 
 
-def estimate_market_volatility(returns_df: pd.DataFrame, 
-                               market_proxy: str = 'SPY') -> float:
+def estimate_market_volatility(returns: Union[pd.DataFrame, np.ndarray],
+                               market_proxy: str = 'SPY',
+                               symbols: Optional[List[str]] = None) -> float:
     """
     Compute market volatility from proxy (SPY, ^GSPC, etc.).
-    
+
     Args:
-        returns_df: Returns DataFrame
+        returns: Returns DataFrame or (T x N) array
         market_proxy: Market proxy ticker
-        
+        symbols: Column names when returns is an array
+
     Returns:
         Market volatility (annualized)
     """
-    if market_proxy in returns_df.columns:
-        market_returns = returns_df[market_proxy]
+    if isinstance(returns, pd.DataFrame):
+        symbols = list(returns.columns)
+        returns = returns.values
+
+    if symbols is not None and market_proxy in symbols:
+        market_returns = returns[:, symbols.index(market_proxy)]
     else:
         # Use equal-weighted portfolio as proxy
-        market_returns = returns_df.mean(axis=1)
-    
+        market_returns = returns.mean(axis=1)
+
     # GARCH on market returns
     vol = estimate_garch_volatilities(
-        market_returns.to_frame(),
+        market_returns.reshape(-1, 1),
         p=1, q=1
     )[0]
-    
+
     return vol
 
 
+class RollingMoments:
+    """
+    Incremental first and second moments over a rolling return window.
+
+    Maintains running sums sum(x) and sum(x x^T) next to a circular
+    buffer, so pushing one observation costs one rank-1 update, O(N^2),
+    instead of recomputing the moments from the full window, O(T N^2).
+    In the live loop only the newest row changes per tick, which makes
+    the full recompute ~T times more work than necessary.
+    """
+
+    def __init__(self, window: int, n_assets: int):
+        """
+        Initialize the accumulators.
+
+        Args:
+            window: Rolling window length (observations)
+            n_assets: Number of assets (columns)
+        """
+        self.window = window
+        self._buf = np.zeros((window, n_assets))
+        self._pos = 0
+        self._count = 0
+        self._sum_x = np.zeros(n_assets)
+        self._sum_xy = np.zeros((n_assets, n_assets))
+
+    def push(self, new_row: np.ndarray) -> None:
+        """
+        Append one observation, evicting the oldest once full.
+
+        Args:
+            new_row: Return vector for the new period (N,)
+        """
+        new_row = np.asarray(new_row, dtype=np.float64).ravel()
+        if self._count == self.window:
+            old = self._buf[self._pos]
+            self._sum_x -= old
+            self._sum_xy -= np.outer(old, old)
+        else:
+            self._count += 1
+        self._sum_x += new_row
+        self._sum_xy += np.outer(new_row, new_row)
+        self._buf[self._pos] = new_row
+        self._pos = (self._pos + 1) % self.window
+
+    @property
+    def count(self) -> int:
+        """Observations currently in the window."""
+        return self._count
+
+    def values(self) -> np.ndarray:
+        """Window contents in chronological order (T x N)."""
+        if self._count < self.window:
+            return self._buf[:self._count]
+        return np.concatenate((self._buf[self._pos:], self._buf[:self._pos]))
+
+    def mean(self) -> np.ndarray:
+        """Per-asset means recovered from the running sum, O(N)."""
+        return self._sum_x / self._count
+
+    def correlation(self) -> np.ndarray:
+        """
+        Correlation matrix recovered from the running sums, O(N^2).
+
+        Returns:
+            Correlation matrix (N x N)
+        """
+        t = self._count
+        cov = self._sum_xy / t - np.outer(self._sum_x, self._sum_x) / (t * t)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inv_std = 1.0 / np.sqrt(np.diag(cov))
+            correlation = cov * inv_std[:, None]
+            correlation *= inv_std[None, :]
+        np.fill_diagonal(correlation, 1.0)
+        return np.clip(correlation, -1.0, 1.0)
+
+
 class RiskModel:
     """
     Integrates GARCH, correlation stress, and CAPM for complete risk estimation.
     """
-    
+
     def __init__(self, params: Optional[Dict] = None):
         """
         Initialize risk model.
@@ -69,52 +152,76 @@ class RiskModel:
             vol_threshold=self.params.get('volatility_threshold', 0.23),
             max_corr=self.params.get('correlation_breakdown', 0.85)
         )
-        
-    def update(self, 
-               returns_df: pd.DataFrame, 
-               market_return: float = 0.10) -> Dict:
+
+        self._rolling: Optional[RollingMoments] = None
+
+    def update(self,
+               returns: Union[pd.DataFrame, np.ndarray],
+               market_return: float = 0.10,
+               symbols: Optional[List[str]] = None) -> Dict:
         """
         Update all risk model components.
-        
+
         Args:
-            returns_df: DataFrame (T × n) of recent returns
+            returns: DataFrame or (T × n) array of recent returns.
+                Passing the raw array avoids a DataFrame build per call
+                (the live loop calls this every rebalance cycle).
             market_return: Expected market return (annual)
-            
+            symbols: Column names when returns is an array
+
         Returns:
             Dictionary with mu, Sigma, sigma_market, betas, alpha_stress, avg_correlation
         """
+        if isinstance(returns, pd.DataFrame):
+            symbols = list(returns.columns)
+            returns = returns.values
+
         # 1. Estimate volatilities via GARCH
-        volatilities = estimate_garch_volatilities(returns_df, p=1, q=1)
-        
-        # 2. Estimate market volatility
-        sigma_market = estimate_market_volatility(returns_df, self.market_proxy)
-        
+        volatilities = estimate_garch_volatilities(returns, p=1, q=1)
+
+        # 2. Market volatility. When the proxy column is present its
+        # GARCH fit already happened in step 1, so reuse it rather
+        # than refitting the same series; the equal-weighted fallback
+        # still needs its own fit
+        if symbols is not None and self.market_proxy in symbols:
+            sigma_market = float(volatilities[symbols.index(self.market_proxy)])
+        else:
+            sigma_market = estimate_market_volatility(
+                returns, self.market_proxy, symbols)
+
         # 3. Compute stress-adjusted covariance
         Sigma, alpha_stress = self.stress_corr.compute_stress_covariance(
-            returns_df,
+            returns,
             volatilities,
             sigma_market
         )
-        
+
         # 4. Estimate CAPM betas
-        if self.market_proxy in returns_df.columns:
-            market_returns = returns_df[self.market_proxy].values
+        if symbols is not None and self.market_proxy in symbols:
+            market_returns = returns[:, symbols.index(self.market_proxy)]
         else:
-            market_returns = returns_df.mean(axis=1).values
-        
-        betas = self.capm.calculate_betas(returns_df.values, market_returns)
-        
-        # 5. Compute expected returns with stress adjustment
-        correlation_matrix = returns_df.corr().values
+            market_returns = returns.mean(axis=1)
+
+        betas = self.capm.calculate_betas(returns, market_returns)
+
+        # 5. Compute expected returns with stress adjustment. The base
+        # correlation was memoized during the stress covariance step,
+        # so this lookup costs nothing extra
+        correlation_matrix = self.stress_corr.estimate_correlation(returns)
         n = correlation_matrix.shape[0]
-        avg_corr = (np.sum(np.abs(correlation_matrix)) - n) / (n * (n - 1))
-        
-        # Correlations with market
-        rho_stress = np.array([
-            np.corrcoef(returns_df.iloc[:, i].values, market_returns)[0, 1]
-            for i in range(returns_df.shape[1])
-        ])
-        
+        if HAS_NUMBA:
+            # One triangle pass, no N x N abs temporary
+            avg_corr = mean_abs_offdiag(
+                np.ascontiguousarray(correlation_matrix))
+        else:
+            avg_corr = (np.sum(np.abs(correlation_matrix)) - n) / (n * (n - 1))
+
+        # Market correlations come from the same memoized regression
+        # pass that produced the betas — one BLAS product for all
+        # assets instead of N corrcoef calls
+        _, rho_stress, _ = self.capm._fit_market(returns, market_returns)
+
+
         mu = self.capm.compute_expected_returns(
             betas,
             sigma_market,
@@ -132,3 +239,46 @@ class RiskModel:
             'volatilities': volatilities,
             'rho_stress': rho_stress
         }
+
+    def update_incremental(self,
+                           new_row: np.ndarray,
+                           market_return: float = 0.10,
+                           symbols: Optional[List[str]] = None,
+                           window: int = 252) -> Optional[Dict]:
+        """
+        Push one new return observation and refresh the risk model.
+
+        The rolling accumulators recover the window's correlation in
+        O(N^2) per tick instead of the O(T N^2) recompute the full
+        `update` path performs, and that matrix is seeded into the
+        correlation cache so the downstream pipeline reuses it. The
+        GARCH fits still see the full window (they are recursive in T
+        by construction), so this targets the moment recomputation the
+        live loop repeats every cycle.
+
+        Args:
+            new_row: Return vector for the latest period (N,)
+            market_return: Expected market return (annual)
+            symbols: Column names for the return vector
+            window: Rolling window length, fixed at the first call
+
+        Returns:
+            The `update` result dictionary, or None while the window is
+            still shorter than two observations
+        """
+        new_row = np.asarray(new_row, dtype=np.float64).ravel()
+        if self._rolling is None:
+            self._rolling = RollingMoments(window, new_row.shape[0])
+        self._rolling.push(new_row)
+
+        if self._rolling.count < 2:
+            return None
+
+        values = self._rolling.values()
+        # Seed through the bounded insert: every pushed row creates a
+        # fresh fingerprint, so raw dict writes would grow forever
+        self.stress_corr._cache_put(
+            self.stress_corr._fingerprint(values),
+            self._rolling.correlation())
+
+        return self.update(values, market_return, symbols)
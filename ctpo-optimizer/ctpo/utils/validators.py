@@ -3,7 +3,50 @@ Constraint and solution validators
 """
 
 import numpy as np
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; fall back to vectorized NumPy
+    HAS_NUMBA = False
+
+
+def _weight_stats_kernel(weights: np.ndarray):
+    """
+    Sum, min, max and finiteness of a weight vector in one pass.
+
+    The separate sum / bounds / NaN checks in validate_weights each
+    rescan the array; on large universes the checks are memory-bound,
+    so one sweep halves the bytes read.
+
+    Args:
+        weights: Portfolio weights (1-D float array)
+
+    Returns:
+        (total, lo, hi, all_finite); lo/hi ignore NaNs, which the
+        finiteness flag reports separately
+    """
+    total = 0.0
+    lo = np.inf
+    hi = -np.inf
+    all_finite = True
+    for i in range(weights.shape[0]):
+        x = weights[i]
+        total += x
+        if x < lo:
+            lo = x
+        if x > hi:
+            hi = x
+        if not np.isfinite(x):
+            all_finite = False
+    return total, lo, hi, all_finite
+
+
+if HAS_NUMBA:
+    _weight_stats_kernel = njit('Tuple((f8, f8, f8, b1))(f8[::1])',
+                                cache=True)(_weight_stats_kernel)
 
 
 class PortfolioValidator:
@@ -36,23 +79,34 @@ class PortfolioValidator:
             (valid, list of violations)
         """
         violations = []
-        
+
+        # All four checks come from one sweep instead of five scans
+        arr = np.ascontiguousarray(weights, dtype=np.float64).ravel()
+        if HAS_NUMBA:
+            weight_sum, lo, hi, all_finite = _weight_stats_kernel(arr)
+            below = lo < min_weight - self.tolerance
+            above = hi > max_weight + self.tolerance
+        else:
+            weight_sum = np.add.reduce(arr)
+            below = bool(np.any(arr < min_weight - self.tolerance))
+            above = bool(np.any(arr > max_weight + self.tolerance))
+            all_finite = bool(np.isfinite(arr).all())
+
         # Check sum to 1
-        weight_sum = np.sum(weights)
         if abs(weight_sum - 1.0) > self.tolerance:
             violations.append(f"Weights sum to {weight_sum:.6f}, not 1.0")
-        
+
         # Check bounds
-        if np.any(weights < min_weight - self.tolerance):
+        if below:
             violations.append(f"Weights below minimum {min_weight}")
-        
-        if np.any(weights > max_weight + self.tolerance):
+
+        if above:
             violations.append(f"Weights above maximum {max_weight}")
-        
+
         # Check for NaN or inf
-        if np.any(np.isnan(weights)) or np.any(np.isinf(weights)):
+        if not all_finite:
             violations.append("Weights contain NaN or Inf")
-        
+
         return len(violations) == 0, violations
     
     def validate_solution(self,
@@ -75,19 +129,29 @@ class PortfolioValidator:
             'constraints_satisfied': False,
             'violations': []
         }
-        
-        # Validate weights
+
         min_weight = constraints.get('min_weight', 0.0)
         max_weight = constraints.get('max_weight', 1.0)
-        weights_valid, weight_violations = self.validate_weights(
-            weights, min_weight, max_weight
-        )
-        
-        report['weights_valid'] = weights_valid
-        report['violations'].extend(weight_violations)
-        
-        # TODO: Add more constraint checks in later chunks
-        
+
+        # Each check returns (valid, violations) over its own buffers.
+        # Checks added in later chunks slot into this list and run in
+        # one batch rather than as sequential array traversals
+        checks: List[Callable[[], Tuple[bool, List[str]]]] = [
+            lambda: self.validate_weights(weights, min_weight, max_weight),
+        ]
+
+        if len(checks) > 1 and np.asarray(weights).size > 1000:
+            # Independent NumPy-bound checks release the GIL, so on
+            # large universes they overlap across threads
+            with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+                results = list(pool.map(lambda check: check(), checks))
+        else:
+            results = [check() for check in checks]
+
+        report['weights_valid'] = results[0][0]
+        for _, check_violations in results:
+            report['violations'].extend(check_violations)
+
         report['constraints_satisfied'] = len(report['violations']) == 0
-        
+
         return report['constraints_satisfied'], report
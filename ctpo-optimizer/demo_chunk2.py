@@ -17,6 +17,7 @@ from ctpo.risk.correlation import StressCorrelation
 from ctpo.risk.garch import estimate_garch_volatilities
 from ctpo.core.constraints import (
     construct_structure_matrix,
+    apply_structure_matrix,
     construct_wrench_vector,
     force_balance_residual,
     compute_effective_n_assets,
@@ -131,7 +132,9 @@ print()
 
 # Test with equal weights
 weights_equal = np.ones(n_assets) / n_assets
-force_applied = A @ weights_equal
+# Matrix-free apply: same A @ w in O(N) without rebuilding A per bar
+force_applied = apply_structure_matrix(betas, volatilities, weights_equal,
+                                       stiffness=310.0)
 
 print(f"   Equal weights force: {force_applied}")
 print(f"   Target wrench: {W}")
@@ -1,5 +1,21 @@
 from setuptools import setup, find_packages
 
+# Optional Cython extension for the per-rebalance pre-solve arithmetic;
+# the package works without it (pure NumPy/Numba fallbacks)
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ["ctpo/core/_fast.pyx"],
+        language_level=3,
+        compiler_directives={
+            "boundscheck": False,
+            "wraparound": False,
+            "cdivision": True,
+        },
+    )
+except ImportError:
+    ext_modules = []
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -21,4 +37,5 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    ext_modules=ext_modules,
 )
@@ -0,0 +1,28 @@
+"""
+Shared pytest configuration: put the project root on sys.path once
+instead of repeating the insert in every test module.
+"""
+
+import sys
+import pathlib
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _jit_warmup():
+    """Pay JIT compilation and solver canonicalization before any test.
+
+    The first optimize in a process triggers numba compilation and
+    cvxpy's first canonicalization; running a throwaway solve here
+    keeps that cold-start cost out of every timed test (one warm-up
+    per worker under pytest-xdist).
+    """
+    from ctpo.core.optimizer import CTPOOptimizer
+
+    CTPOOptimizer().optimize(
+        np.random.default_rng(0).standard_normal((20, 5)) * 0.02
+    )
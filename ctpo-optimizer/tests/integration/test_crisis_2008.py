@@ -7,11 +7,8 @@ Validates CTPO performance during extreme market stress
 import pytest
 import numpy as np
 import pandas as pd
-import sys
-from pathlib import Path
 import warnings
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from ctpo.data.fetcher import DataFetcher
 from ctpo.core.optimizer import CTPOOptimizer
@@ -78,7 +75,7 @@ class TestCrisis2008Performance:
         
         # Equal-weight baseline
         n_assets = returns.shape[1]
-        weights_ew = np.ones(n_assets) / n_assets
+        weights_ew = np.full(n_assets, 1.0 / n_assets)
         portfolio_returns_ew = returns @ weights_ew
         sharpe_ew = PerformanceMetrics.sharpe_ratio(portfolio_returns_ew)
         
@@ -109,7 +106,7 @@ class TestCrisis2008Performance:
         
         # Equal-weight baseline
         n_assets = returns.shape[1]
-        weights_ew = np.ones(n_assets) / n_assets
+        weights_ew = np.full(n_assets, 1.0 / n_assets)
         portfolio_returns_ew = returns @ weights_ew
         dd_ew = abs(PerformanceMetrics.max_drawdown(portfolio_returns_ew))
         
@@ -145,7 +142,7 @@ class TestCrisis2008Performance:
         
         # Should at least beat equal-weight
         n_assets = returns.shape[1]
-        weights_ew = np.ones(n_assets) / n_assets
+        weights_ew = np.full(n_assets, 1.0 / n_assets)
         portfolio_returns_ew = returns @ weights_ew
         total_return_ew = PerformanceMetrics.total_return(portfolio_returns_ew)
         
@@ -2,78 +2,38 @@
 Basic import test
 """
 
-import pytest
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-
-def test_import_core():
-    """Test core module imports."""
-    from ctpo.core.optimizer import CTPOOptimizer
-    from ctpo.core.constraints import CableConstraints, PortfolioConstraints
-    from ctpo.core.objective import ObjectiveFunction
-    
-    assert CTPOOptimizer is not None
-    assert CableConstraints is not None
-    assert PortfolioConstraints is not None
-    assert ObjectiveFunction is not None
-
-
-def test_import_risk():
-    """Test risk module imports."""
-    from ctpo.risk.garch import GARCHModel
-    from ctpo.risk.correlation import StressCorrelation
-    from ctpo.risk.capm import CAPMModel
-    
-    assert GARCHModel is not None
-    assert StressCorrelation is not None
-    assert CAPMModel is not None
-
+import importlib
 
-def test_import_data():
-    """Test data module imports."""
-    from ctpo.data.fetcher import DataFetcher
-    from ctpo.data.preprocessor import DataPreprocessor
-    
-    assert DataFetcher is not None
-    assert DataPreprocessor is not None
-
-
-def test_import_execution():
-    """Test execution module imports."""
-    from ctpo.execution.backtester import Backtester
-    from ctpo.execution.paper_trader import PaperTrader
-    from ctpo.execution.alpaca_broker import MockAlpacaBroker
-    
-    assert Backtester is not None
-    assert PaperTrader is not None
-    assert MockAlpacaBroker is not None
-
-
-def test_import_metrics():
-    """Test metrics module imports."""
-    from ctpo.metrics.performance import PerformanceMetrics
-    
-    assert PerformanceMetrics is not None
+import pytest
 
 
-def test_import_utils():
-    """Test utils module imports."""
-    from ctpo.utils.matrix_ops import MatrixOps
-    from ctpo.utils.validators import PortfolioValidator
-    
-    assert MatrixOps is not None
-    assert PortfolioValidator is not None
+@pytest.mark.parametrize(("mod", "attr"), [
+    ("ctpo.core.optimizer", "CTPOOptimizer"),
+    ("ctpo.core.constraints", "CableConstraints"),
+    ("ctpo.core.constraints", "PortfolioConstraints"),
+    ("ctpo.core.objective", "ObjectiveFunction"),
+    ("ctpo.risk.garch", "GARCHModel"),
+    ("ctpo.risk.correlation", "StressCorrelation"),
+    ("ctpo.risk.capm", "CAPMModel"),
+    ("ctpo.data.fetcher", "DataFetcher"),
+    ("ctpo.data.preprocessor", "DataPreprocessor"),
+    ("ctpo.execution.backtester", "Backtester"),
+    ("ctpo.execution.paper_trader", "PaperTrader"),
+    ("ctpo.execution.alpaca_broker", "MockAlpacaBroker"),
+    ("ctpo.metrics.performance", "PerformanceMetrics"),
+    ("ctpo.utils.matrix_ops", "MatrixOps"),
+    ("ctpo.utils.validators", "PortfolioValidator"),
+])
+def test_import(mod, attr):
+    """Each public entry point imports and exposes its class."""
+    assert getattr(importlib.import_module(mod), attr) is not None
 
 
 def test_package_import():
     """Test main package import."""
     import ctpo
     from ctpo import CTPOOptimizer, DataFetcher
-    
+
     assert ctpo.__version__ == "0.1.0"
     assert CTPOOptimizer is not None
     assert DataFetcher is not None
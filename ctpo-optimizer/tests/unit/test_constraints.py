@@ -4,10 +4,7 @@ Unit tests for constraints
 
 import pytest
 import numpy as np
-import sys
-import os
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from ctpo.core.constraints import CableConstraints, PortfolioConstraints
 
@@ -4,17 +4,19 @@ Unit tests for CTPO optimizer
 
 import pytest
 import numpy as np
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from ctpo.core.optimizer import CTPOOptimizer
 from ctpo.core.constraints import CableConstraints, PortfolioConstraints
 from ctpo.core.objective import ObjectiveFunction
 
 
+@pytest.fixture(scope="module")
+def returns_100x5():
+    """Shared 100 x 5 return matrix, generated once per module."""
+    rng = np.random.default_rng(42)
+    return rng.standard_normal((100, 5)) * 0.01
+
+
 def test_optimizer_initialization():
     """Test optimizer can be initialized."""
     optimizer = CTPOOptimizer()
@@ -27,10 +29,10 @@ def test_optimizer_basic_optimization():
     optimizer = CTPOOptimizer()
     
     # Create dummy returns data
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n_days = 100
     n_assets = 10
-    returns = np.random.randn(n_days, n_assets) * 0.01
+    returns = rng.standard_normal((n_days, n_assets)) * 0.01
     
     # Run optimization
     weights = optimizer.optimize(returns)
@@ -66,17 +68,14 @@ def test_portfolio_constraints():
     assert satisfied
 
 
-def test_objective_function():
+def test_objective_function(returns_100x5):
     """Test objective function evaluation."""
     objective = ObjectiveFunction(var_confidence=0.95)
-    
-    # Create dummy data
-    np.random.seed(42)
-    returns = np.random.randn(100, 5) * 0.01
-    weights = np.ones(5) / 5
-    
+
+    weights = np.full(5, 0.2)
+
     # Evaluate objective
-    obj_value = objective.evaluate(weights, returns)
+    obj_value = objective.evaluate(weights, returns_100x5)
     assert obj_value > 0
     assert not np.isnan(obj_value)
     assert not np.isinf(obj_value)